@@ -575,12 +575,7 @@ class GoonwareApp:
                 # Check if there are any windows open before closing
                 window_count_before = 0
                 if hasattr(self.media_display, 'window_manager'):
-                    if hasattr(self.media_display.window_manager, 'current_windows'):
-                        window_count_before += len(self.media_display.window_manager.current_windows)
-                    if hasattr(self.media_display.window_manager, 'gif_windows'):
-                        window_count_before += len(self.media_display.window_manager.gif_windows)
-                    if hasattr(self.media_display.window_manager, 'video_windows'):
-                        window_count_before += len(self.media_display.window_manager.video_windows)
+                    window_count_before = self.media_display.window_manager.window_count()
                 
                 logger.info(f"Found {window_count_before} windows before cleanup")
                 popups_were_closed = window_count_before > 0 or is_running
@@ -650,13 +645,7 @@ class GoonwareApp:
                     
                     # CRITICAL FIX: Verify all windows are closed
                     if hasattr(self.media_display, 'window_manager'):
-                        window_count = 0
-                        if hasattr(self.media_display.window_manager, 'current_windows'):
-                            window_count += len(self.media_display.window_manager.current_windows)
-                        if hasattr(self.media_display.window_manager, 'gif_windows'):
-                            window_count += len(self.media_display.window_manager.gif_windows)
-                        if hasattr(self.media_display.window_manager, 'video_windows'):
-                            window_count += len(self.media_display.window_manager.video_windows)
+                        window_count = self.media_display.window_manager.window_count()
                         
                         if window_count > 0:
                             logger.warning(f"Still have {window_count} windows after cleanup, forcing close again")
@@ -920,6 +909,13 @@ class GoonwareApp:
                 except:
                     pass
             
+            # Write any pending config changes
+            if hasattr(self, 'media_manager'):
+                try:
+                    self.media_manager.flush_config()
+                except:
+                    pass
+            
             # Clean up app manager
             if hasattr(self, 'app_manager'):
                 try:
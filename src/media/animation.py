@@ -94,9 +94,9 @@ class AnimationManager:
             # Clear all window velocities to prevent further animation
             try:
                 # CRITICAL FIX: Clear velocities from window_manager
-                if hasattr(self.display, 'window_manager') and hasattr(self.display.window_manager, 'window_velocities'):
+                if hasattr(self.display, 'window_manager') and hasattr(self.display.window_manager, 'clear_velocities'):
                     logger.info("Clearing window velocities")
-                    self.display.window_manager.window_velocities.clear()
+                    self.display.window_manager.clear_velocities()
             except Exception as e:
                 logger.error(f"Error clearing window velocities: {e}")
             
@@ -125,8 +125,8 @@ class AnimationManager:
             
             # CRITICAL FIX: Double-check velocities are cleared
             try:
-                if hasattr(self.display, 'window_manager') and hasattr(self.display.window_manager, 'window_velocities'):
-                    self.display.window_manager.window_velocities.clear()
+                if hasattr(self.display, 'window_manager') and hasattr(self.display.window_manager, 'clear_velocities'):
+                    self.display.window_manager.clear_velocities()
             except:
                 pass
             
@@ -137,8 +137,8 @@ class AnimationManager:
             try:
                 self.bounce_running = False
                 self.bounce_thread = None
-                if hasattr(self.display, 'window_manager') and hasattr(self.display.window_manager, 'window_velocities'):
-                    self.display.window_manager.window_velocities.clear()
+                if hasattr(self.display, 'window_manager') and hasattr(self.display.window_manager, 'clear_velocities'):
+                    self.display.window_manager.clear_velocities()
             except:
                 pass
     
@@ -184,7 +184,7 @@ class AnimationManager:
                     
                     # Log bounce status
                     bounce_enabled = getattr(self.display, 'bounce_enabled', False)
-                    window_count = len(self.display.window_manager.window_velocities) if hasattr(self.display, 'window_manager') else 0
+                    window_count = len(self.display.window_manager.bouncing_windows()) if hasattr(self.display, 'window_manager') else 0
                     print(f"DEBUG BOUNCE_LOOP: Bounce enabled: {bounce_enabled}, Bouncing windows: {window_count}")
                 
                 # Check if we should exit
@@ -208,15 +208,13 @@ class AnimationManager:
     def _update_bouncing_windows(self):
         """Update all bouncing windows in one step"""
         # Skip if no window manager available
-        if not hasattr(self.display, 'window_manager') or not hasattr(self.display.window_manager, 'window_velocities'):
+        if not hasattr(self.display, 'window_manager') or not hasattr(self.display.window_manager, 'bouncing_windows'):
             return
             
         # Get all windows with velocities
-        velocities = self.display.window_manager.window_velocities
-        if not velocities:
+        windows = self.display.window_manager.bouncing_windows()
+        if not windows:
             return
-            
-        windows = list(velocities.keys())
         
         # Process windows in batches for better performance
         for i in range(0, len(windows), self.batch_size):
@@ -235,20 +233,22 @@ class AnimationManager:
                 if not window.winfo_exists():
                     if should_debug:
                         print(f"DEBUG BOUNCE_LOOP: Window no longer exists, removing from tracking")
-                    if window in self.display.window_manager.window_velocities:
-                        del self.display.window_manager.window_velocities[window]
+                    self.display.window_manager.clear_velocity(window)
                     continue
                     
                 # Get current position and velocity
+                velocity = self.display.window_manager.get_velocity(window)
+                if velocity is None:
+                    continue
                 x, y = window.winfo_x(), window.winfo_y()
-                dx, dy = self.display.window_manager.window_velocities[window]
+                dx, dy = velocity
                 
                 # Get window dimensions
                 width = window.winfo_width()
                 height = window.winfo_height()
                 
                 # Get the monitor this window belongs to
-                monitor_idx = self.display.window_manager.window_monitors.get(window, 0)
+                monitor_idx = self.display.window_manager.get_monitor(window, 0)
                 
                 # Get the monitor boundaries
                 if hasattr(self.display, 'monitors') and monitor_idx < len(self.display.monitors):
@@ -328,7 +328,7 @@ class AnimationManager:
                 dy = max(-self.max_velocity, min(self.max_velocity, dy))
                 
                 # Update velocity
-                self.display.window_manager.window_velocities[window] = (dx, dy)
+                self.display.window_manager.set_velocity(window, (dx, dy))
                 
                 # Ensure the window stays within its monitor boundaries
                 new_x = max(min_x, min(max_x - width, new_x))
@@ -344,18 +344,14 @@ class AnimationManager:
             except Exception as e:
                 logger.error(f"Error processing bouncing window: {e}")
                 # Remove problematic window from tracking
-                if window in self.display.window_manager.window_velocities:
-                    del self.display.window_manager.window_velocities[window]
+                self.display.window_manager.clear_velocity(window)
     
     def animate_gif(self, window):
         """Animate a GIF by updating frames at specified intervals"""
         try:
-            if window not in self.display.window_manager.gif_windows or not window.winfo_exists():
-                return
-                
             # Get GIF data
-            gif_data = self.display.window_manager.gif_windows.get(window)
-            if not gif_data:
+            gif_data = self.display.window_manager.get_window_info(window, 'gif')
+            if not gif_data or not window.winfo_exists():
                 return
                 
             frames = gif_data['frames']
@@ -374,7 +370,7 @@ class AnimationManager:
                     
                     # Update current frame
                     current_frame = (current_frame + 1) % len(frames)
-                    self.display.window_manager.gif_windows[window]['current_frame'] = current_frame
+                    gif_data['current_frame'] = current_frame
                     
                     # Schedule next frame update
                     window.after(int(delay * 1000), lambda: self.animate_gif(window))
@@ -389,12 +385,9 @@ class AnimationManager:
     def play_video(self, window):
         """Play a video in the window by reading frames from the video capture"""
         try:
-            if window not in self.display.window_manager.video_windows or not window.winfo_exists():
-                return
-                
             # Get video data
-            video_data = self.display.window_manager.video_windows.get(window)
-            if not video_data:
+            video_data = self.display.window_manager.get_window_info(window, 'video')
+            if not video_data or not window.winfo_exists():
                 return
                 
             cap = video_data['cap']
@@ -436,10 +429,11 @@ class AnimationManager:
             # Don't reschedule if there's an error
             try:
                 # Remove video from active list
-                if window in self.display.window_manager.video_windows:
-                    if 'cap' in self.display.window_manager.video_windows[window]:
+                video_data = self.display.window_manager.get_window_info(window, 'video')
+                if video_data:
+                    if 'cap' in video_data:
                         try:
-                            self.display.window_manager.video_windows[window]['cap'].release()
+                            video_data['cap'].release()
                         except:
                             pass
             except:
@@ -288,13 +288,13 @@ class GifLoader(MediaLoaderBase):
             avg_delay = max(40, min(avg_delay, 200))  # Between 40-200ms
             
             # Store animation info
-            self.display.window_manager.gif_windows[window] = {
+            self.display.window_manager.set_window_info(window, 'gif', {
                 'frames': frames,
                 'current_frame': 0,
                 'label': label,
                 'delay': avg_delay,
                 'gif_data': None  # Don't store the gif_data to save memory
-            }
+            })
             
             # Start animation
             self.display.animation_manager.animate_gif(window)
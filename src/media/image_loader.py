@@ -85,7 +85,8 @@ class ImageLoader(MediaLoaderBase):
             window.attributes('-topmost', True)
             window.lift()
             
-            # Add to window manager
+            # Add to window manager, tagged so it is recycled into the pool on removal
+            self.display.window_manager.set_window_info(window, 'image')
             self.display.window_manager.add_window(window, enable_bounce=True)
             
             # Start preloading the next batch of images
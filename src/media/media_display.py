@@ -278,6 +278,7 @@ class MediaDisplay:
                 if hasattr(self, 'window_manager'):
                     # Use clear_windows instead of clear
                     self.window_manager.clear_windows()
+                    self.window_manager.shutdown_release_pool()
             except Exception as e:
                 logger.error(f"Error clearing window manager: {e}")
             
@@ -387,21 +388,15 @@ class MediaDisplay:
                     try:
                         logger.info("Fallback: trying to close windows directly")
                         # Try to close all types of windows
-                        for collection_name in ['current_windows', 'gif_windows', 'video_windows']:
-                            if hasattr(self.window_manager, collection_name):
-                                collection = getattr(self.window_manager, collection_name)
-                                # Handle different collection types
-                                if isinstance(collection, dict):
-                                    windows = list(collection.keys())
-                                else:
-                                    windows = list(collection)
-                                
-                                for window in windows:
-                                    try:
-                                        if hasattr(window, 'winfo_exists') and window.winfo_exists():
-                                            window.destroy()
-                                    except:
-                                        pass
+                        # GIF and video windows are listed too, so this covers every popup
+                        windows = self.window_manager.listed_windows()
+                        
+                        for window in windows:
+                            try:
+                                if hasattr(window, 'winfo_exists') and window.winfo_exists():
+                                    window.destroy()
+                            except:
+                                pass
                     except Exception as e2:
                         logger.error(f"Error in fallback window closing: {e2}")
             
@@ -418,29 +413,13 @@ class MediaDisplay:
             # CRITICAL FIX: Verify all windows are closed
             window_count = 0
             if hasattr(self, 'window_manager'):
-                if hasattr(self.window_manager, 'current_windows'):
-                    window_count += len(self.window_manager.current_windows)
-                if hasattr(self.window_manager, 'gif_windows'):
-                    window_count += len(self.window_manager.gif_windows)
-                if hasattr(self.window_manager, 'video_windows'):
-                    window_count += len(self.window_manager.video_windows)
+                window_count = self.window_manager.window_count()
             
             if window_count > 0:
                 logger.warning(f"Still have {window_count} windows after cleanup, resetting collections")
                 # Reset all collections as a last resort
                 if hasattr(self, 'window_manager'):
-                    if hasattr(self.window_manager, 'current_windows'):
-                        self.window_manager.current_windows = []
-                    if hasattr(self.window_manager, 'gif_windows'):
-                        self.window_manager.gif_windows = {}
-                    if hasattr(self.window_manager, 'video_windows'):
-                        self.window_manager.video_windows = {}
-                    if hasattr(self.window_manager, 'window_velocities'):
-                        self.window_manager.window_velocities = {}
-                    if hasattr(self.window_manager, 'window_creation_times'):
-                        self.window_manager.window_creation_times = {}
-                    if hasattr(self.window_manager, 'window_monitors'):
-                        self.window_manager.window_monitors = {}
+                    self.window_manager.reset_tracking()
             
             logger.info("Force close completed from media_display")
         except Exception as e:
@@ -448,18 +427,7 @@ class MediaDisplay:
             # Last resort cleanup
             try:
                 if hasattr(self, 'window_manager'):
-                    if hasattr(self.window_manager, 'current_windows'):
-                        self.window_manager.current_windows = []
-                    if hasattr(self.window_manager, 'gif_windows'):
-                        self.window_manager.gif_windows = {}
-                    if hasattr(self.window_manager, 'video_windows'):
-                        self.window_manager.video_windows = {}
-                    if hasattr(self.window_manager, 'window_velocities'):
-                        self.window_manager.window_velocities = {}
-                    if hasattr(self.window_manager, 'window_creation_times'):
-                        self.window_manager.window_creation_times = {}
-                    if hasattr(self.window_manager, 'window_monitors'):
-                        self.window_manager.window_monitors = {}
+                    self.window_manager.reset_tracking()
                 self.currently_displayed = 0
             except Exception as e2:
                 logger.error(f"Error in last resort cleanup: {e2}")
@@ -523,15 +491,15 @@ class MediaDisplay:
             self.animation_manager.start_bounce_thread()
         elif not enabled:
             # If bounce is disabled, remove all velocities
-            if hasattr(self.window_manager, 'window_velocities'):
-                self.window_manager.window_velocities.clear()
+            if hasattr(self.window_manager, 'clear_velocities'):
+                self.window_manager.clear_velocities()
                 print(f"DEBUG BOUNCE_SET: Cleared all window velocities because bounce was disabled")
         
     def set_active_monitors(self, monitor_indices):
         """Set which monitors should display popups"""
         try:
-            # Force refresh monitors
-            self.monitors = self._get_monitors()
+            # Indices are checked against the monitors detected at init or the last start(). start()
+            # re-detects them and popup placement re-checks indices, so no enumeration is needed here.
             
             # CRITICAL FIX: Print the raw input for debugging
             print(f"DEBUG MONITOR_SET: Raw input monitor_indices: {monitor_indices} (type: {type(monitor_indices)})")
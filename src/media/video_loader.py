@@ -223,8 +223,9 @@ class VideoLoader(MediaLoaderBase):
                     return None
                 
                 # Store temp file path for cleanup
-                if window in self.display.window_manager.video_windows:
-                    self.display.window_manager.video_windows[window]['temp_file'] = temp_file
+                video_info = self.display.window_manager.get_window_info(window, 'video')
+                if video_info is not None:
+                    video_info['temp_file'] = temp_file
                 
                 # Add window to manager and schedule removal
                 self.display.window_manager.add_window(window, enable_bounce=True)
@@ -489,14 +490,14 @@ class VideoLoader(MediaLoaderBase):
             }
             
             # Store window in window manager
-            self.display.window_manager.window_monitors[window] = monitor_idx
-            self.display.window_manager.window_creation_times[window] = time.time()
-            self.display.window_manager.video_windows[window] = {
+            self.display.window_manager.set_monitor(window, monitor_idx)
+            self.display.window_manager.set_creation_time(window, time.time())
+            self.display.window_manager.set_window_info(window, 'video', {
                 'video_id': video_id,
                 'cleanup': lambda: self._close_video(window, video_id),
                 'path': video_path,
                 'temp_file': None
-            }
+            })
             
             # Show the window
             window.deiconify()
@@ -755,8 +756,9 @@ class VideoLoader(MediaLoaderBase):
             
             # Clean up temporary files
             try:
-                if window in self.display.window_manager.video_windows:
-                    temp_file = self.display.window_manager.video_windows[window].get('temp_file')
+                video_info = self.display.window_manager.get_window_info(window, 'video')
+                if video_info is not None:
+                    temp_file = video_info.get('temp_file')
                     if temp_file and os.path.exists(temp_file):
                         if os.path.isdir(temp_file):
                             shutil.rmtree(temp_file, ignore_errors=True)
@@ -893,8 +895,9 @@ class VideoLoader(MediaLoaderBase):
                     # Cancel any pending updates
                     if 'next_update_id' in self.videos[video_id]:
                         try:
-                            window = next((w for w, data in self.display.window_manager.video_windows.items() 
-                                         if data.get('video_id') == video_id), None)
+                            window_manager = self.display.window_manager
+                            window = next((w for w in window_manager.windows_of_kind('video')
+                                         if window_manager.get_window_info(w, 'video').get('video_id') == video_id), None)
                             if window:
                                 window.after_cancel(self.videos[video_id]['next_update_id'])
                         except:
@@ -914,8 +917,9 @@ class VideoLoader(MediaLoaderBase):
                     del self.videos[video_id]
                     
                     # Clean up temp file if it exists
-                    if window in self.display.window_manager.video_windows and 'temp_file' in self.display.window_manager.video_windows[window]:
-                        temp_file = self.display.window_manager.video_windows[window]['temp_file']
+                    video_info = self.display.window_manager.get_window_info(window, 'video')
+                    if video_info is not None and 'temp_file' in video_info:
+                        temp_file = video_info['temp_file']
                         try:
                             if os.path.exists(temp_file):
                                 os.unlink(temp_file)
@@ -1,65 +1,156 @@
 import tkinter as tk
 import logging
 import random
-import traceback
 import os
 import time
+import concurrent.futures
 import cv2
 
 logger = logging.getLogger(__name__)
 
+class WindowRecord:
+    """Tracking state for a single popup window"""
+    __slots__ = ('listed', 'kind', 'info', 'velocity', 'creation_time', 'monitor')
+    
+    def __init__(self):
+        self.listed = False  # Added through add_window (counts towards max_windows)
+        self.kind = None  # 'gif', 'video', 'image' (image loader windows) or None
+        self.info = None  # Loader data for gif/video windows
+        self.velocity = None
+        self.creation_time = None
+        self.monitor = None
+    
+    def is_empty(self):
+        """Check if the record no longer tracks anything"""
+        return (not self.listed and self.kind is None and self.velocity is None and
+                self.creation_time is None and self.monitor is None)
+
 class WindowManager:
     def __init__(self, display):
         self.display = display
-        self.current_windows = []
-        self.gif_windows = {}
-        self.video_windows = {}
-        self.window_velocities = {}
         
-        # Performance optimization: track window creation times
-        self.window_creation_times = {}
+        # All per-window state lives in one record per window; records are
+        # dropped explicitly in remove_window
+        self._windows = {}
+        self._listed_count = 0  # Records with listed set, kept in add/remove
         
-        # Track which monitor each window belongs to
-        self.window_monitors = {}
-        
-        # Batch processing for window updates
-        self.pending_updates = []
-        self.last_batch_update = 0
+        # Single worker for releasing video captures and temp files off the UI thread,
+        # created on first use and shut down when the display stops
+        self._release_pool = None
+    
+    def _record(self, window):
+        """Get the tracking record for a window, creating it if needed"""
+        rec = self._windows.get(window)
+        if rec is None:
+            rec = self._windows[window] = WindowRecord()
+        return rec
+    
+    def _discard(self, window, rec):
+        """Drop a record once it no longer tracks anything"""
+        if rec.is_empty():
+            self._windows.pop(window, None)
+    
+    def listed_windows(self):
+        """Get the windows added through add_window, oldest first"""
+        return [w for w, rec in list(self._windows.items()) if rec.listed]
+    
+    def windows_of_kind(self, kind):
+        """Get the windows registered as 'gif' or 'video'"""
+        return [w for w, rec in list(self._windows.items()) if rec.kind == kind]
+    
+    def get_window_info(self, window, kind):
+        """Get the loader data of a gif/video window, or None"""
+        rec = self._windows.get(window)
+        if rec is None or rec.kind != kind:
+            return None
+        return rec.info
+    
+    def set_window_info(self, window, kind, info=None):
+        """Register a window as 'gif', 'video' or 'image' along with its loader data"""
+        rec = self._record(window)
+        rec.kind = kind
+        rec.info = info
+    
+    def get_velocity(self, window):
+        """Get the bounce velocity of a window, or None if it doesn't bounce"""
+        rec = self._windows.get(window)
+        return None if rec is None else rec.velocity
+    
+    def set_velocity(self, window, velocity):
+        """Update the velocity of a window that is already bouncing"""
+        # Never recreate a record or start a bounce: the bounce thread may still hold
+        # a window that remove_window has already dropped (and possibly pooled and reused)
+        rec = self._windows.get(window)
+        if rec is None or rec.velocity is None:
+            return
+        rec.velocity = velocity
+    
+    def clear_velocity(self, window):
+        """Stop a window from bouncing"""
+        rec = self._windows.get(window)
+        if rec is not None:
+            rec.velocity = None
+            self._discard(window, rec)
+    
+    def bouncing_windows(self):
+        """Get the windows that currently have a bounce velocity"""
+        return [w for w, rec in list(self._windows.items()) if rec.velocity is not None]
+    
+    def clear_velocities(self):
+        """Stop all windows from bouncing"""
+        for window, rec in list(self._windows.items()):
+            if rec.velocity is not None:
+                rec.velocity = None
+                self._discard(window, rec)
+    
+    def get_monitor(self, window, default=0):
+        """Get the monitor index a window was placed on"""
+        rec = self._windows.get(window)
+        if rec is None or rec.monitor is None:
+            return default
+        return rec.monitor
+    
+    def set_monitor(self, window, monitor_idx):
+        """Record the monitor index a window was placed on"""
+        self._record(window).monitor = monitor_idx
+    
+    def set_creation_time(self, window, creation_time):
+        """Record when a window was created"""
+        self._record(window).creation_time = creation_time
+    
+    def reset_tracking(self):
+        """Forget all tracked windows without destroying them"""
+        self._windows.clear()
+        self._listed_count = 0
     
     def window_count(self):
         """Get the total number of active windows"""
-        return len(self.current_windows)
+        # Only windows added through add_window count, tracked by a counter so this is O(1)
+        return self._listed_count
     
     def has_windows(self):
         """Check if there are any active windows"""
-        return self.window_count() > 0
+        return self._listed_count > 0
     
     def get_random_screen_position(self, width, height):
         """Get a random position on one of the active monitors"""
         try:
-            # Get position from MediaDisplay
-            print(f"DEBUG WINDOW_MGR: Getting position for window {width}x{height}")
-            print(f"DEBUG WINDOW_MGR: Active monitors: {self.display.active_monitors}")
-            
             # Delegate to MediaDisplay
             position = self.display.get_random_screen_position(width, height)
-            
-            print(f"DEBUG WINDOW_MGR: Got position: {position}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Position for {width}x{height} window: {position}")
             return position
             
         except Exception as e:
-            print(f"DEBUG WINDOW_MGR: Error getting position: {e}")
+            logger.error(f"Error getting window position: {e}")
             # Return a safe default position
             return 100, 100
         
     def create_close_button(self, window):
         """Create a smaller close button with a black background"""
-        close_frame = tk.Frame(window, bg='black', width=14, height=14)
-        close_frame.place(relx=1.0, x=-18, y=3)
-        close_frame.pack_propagate(False)
-
+        # A single placed label - no wrapper frame, one set of bindings
         close_btn = tk.Label(
-            close_frame,
+            window,
             text="×",
             font=('Segoe UI', 9, 'bold'),
             fg='white',
@@ -68,38 +159,32 @@ class WindowManager:
             padx=1,
             pady=0
         )
-        close_btn.pack(expand=True, fill='both')
+        close_btn.place(relx=1.0, x=-18, y=3, width=14, height=14)
 
         # Close functionality
-        def close_window(event):
-            self.remove_window(window)
-
-        close_btn.bind('<Button-1>', close_window)
-        close_frame.bind('<Button-1>', close_window)
+        close_btn.bind('<Button-1>', lambda e: self.remove_window(window))
 
         # Hover effects
-        def on_enter(e):
-            close_btn.configure(fg='red')
-
-        def on_leave(e):
-            close_btn.configure(fg='white')
+        close_btn.bind('<Enter>', lambda e: close_btn.configure(fg='red'))
+        close_btn.bind('<Leave>', lambda e: close_btn.configure(fg='white'))
 
-        close_btn.bind('<Enter>', on_enter)
-        close_btn.bind('<Leave>', on_leave)
-        close_frame.bind('<Enter>', on_enter)
-        close_frame.bind('<Leave>', on_leave)
-
-        return close_frame
+        return close_btn
         
     def add_window(self, window, enable_bounce=False):
         """Add a window to the management list"""
-        # Add window to tracking list
-        self.current_windows.append(window)
+        dbg = logger.isEnabledFor(logging.DEBUG)
+        
+        # Add window to tracking
+        rec = self._record(window)
+        if not rec.listed:
+            rec.listed = True
+            self._listed_count += 1
         
         # Track creation time for performance optimization
-        self.window_creation_times[window] = time.time()
+        rec.creation_time = time.time()
         
-        print(f"DEBUG WINDOW_ADD: Added window to tracking, current count: {len(self.current_windows)}")
+        if dbg:
+            logger.debug(f"Added window to tracking, current count: {self.window_count()}")
         
         # Handle bouncing
         if enable_bounce:
@@ -111,112 +196,133 @@ class WindowManager:
                 bounce_enabled = self.display.bounce_enabled
                 bounce_chance = getattr(self.display, 'bounce_chance', 0.0)
             
-            print(f"DEBUG WINDOW_BOUNCE: Window added with bounce_enabled={bounce_enabled}, bounce_chance={bounce_chance:.4f} ({bounce_chance*100:.1f}%)")
-            
             if bounce_enabled:
+                # One RNG call covers the roll and the initial velocity:
+                # bits 0-1 are the signs, bits 2-4 and 5-7 the magnitudes (5-12)
+                # and the top 24 bits the bounce roll
+                bits = random.getrandbits(32)
+                
                 # Determine if this window should bounce based on the configured chance percentage
-                bounce_roll = random.random()
+                bounce_roll = (bits >> 8) / 16777216.0
                 should_bounce = bounce_roll < bounce_chance
                 
-                print(f"DEBUG WINDOW_BOUNCE: Bounce roll: {bounce_roll:.4f}, threshold: {bounce_chance:.4f} ({bounce_chance*100:.1f}%), should_bounce: {should_bounce}")
+                if dbg:
+                    logger.debug(f"Bounce roll: {bounce_roll:.4f}, threshold: {bounce_chance:.4f}, should_bounce: {should_bounce}")
                 
                 if should_bounce:
                     # Set initial velocity - higher values for more noticeable movement
-                    velocity_x = random.choice([-1, 1]) * random.randint(5, 12)
-                    velocity_y = random.choice([-1, 1]) * random.randint(5, 12)
+                    velocity_x = (1 if bits & 1 else -1) * (5 + ((bits >> 2) & 7))
+                    velocity_y = (1 if bits & 2 else -1) * (5 + ((bits >> 5) & 7))
                     
                     # Add to velocity tracking
-                    self.window_velocities[window] = (velocity_x, velocity_y)
+                    rec.velocity = (velocity_x, velocity_y)
                     
-                    print(f"DEBUG WINDOW_BOUNCE: Added bouncing to window with velocity: ({velocity_x}, {velocity_y})")
                     logger.info(f"Added bouncing to window with velocity: ({velocity_x}, {velocity_y})")
                     
-                    # Ensure animation thread is running
-                    if hasattr(self.display, 'animation_manager'):
-                        print(f"DEBUG WINDOW_BOUNCE: Starting animation thread for new bouncing window")
-                        self.display.animation_manager.start_bounce_thread()
-                else:
-                    print(f"DEBUG WINDOW_BOUNCE: Window not selected for bouncing (roll: {bounce_roll:.4f}, needed < {bounce_chance:.4f} [{bounce_chance*100:.1f}%])")
+                    # Ensure animation thread is running - only call into the animation
+                    # manager when it is actually stopped, so bursts of bouncing windows
+                    # don't repeat the start request (and its "already running" warning)
+                    animation_manager = getattr(self.display, 'animation_manager', None)
+                    if animation_manager is not None and not self._bounce_thread_alive(animation_manager):
+                        animation_manager.start_bounce_thread()
         
         # Remove oldest windows if we exceed the maximum
         self._enforce_window_limit()
     
+    @staticmethod
+    def _bounce_thread_alive(animation_manager):
+        """Check if the bounce animation thread is already running"""
+        thread = animation_manager.bounce_thread
+        return animation_manager.bounce_running and thread is not None and thread.is_alive()
+    
     def _enforce_window_limit(self):
         """Enforce the maximum window limit by removing oldest windows"""
         max_windows = getattr(self.display, 'max_windows', 5)
         
         # Sort windows by creation time if we need to remove any
-        if len(self.current_windows) > max_windows:
-            # Create a list of (window, creation_time) tuples
-            windows_with_times = []
-            for window in self.current_windows:
-                creation_time = self.window_creation_times.get(window, 0)
-                windows_with_times.append((window, creation_time))
+        if self._listed_count > max_windows:
+            listed = [(window, rec.creation_time or 0) for window, rec in list(self._windows.items()) if rec.listed]
             
             # Sort by creation time (oldest first)
-            windows_with_times.sort(key=lambda x: x[1])
+            listed.sort(key=lambda x: x[1])
             
             # Remove oldest windows until we're under the limit
-            windows_to_remove = windows_with_times[:len(self.current_windows) - max_windows]
+            windows_to_remove = listed[:len(listed) - max_windows]
             
             for window, _ in windows_to_remove:
                 logger.info(f"Removing oldest window, exceeding max_windows ({max_windows})")
-                print(f"DEBUG WINDOW_ADD: Removing oldest window, exceeding max_windows ({max_windows})")
                 self.remove_window(window)
     
     def remove_window(self, window):
         """Remove a window and clean up resources"""
         try:
-            # Check if this is a video window
-            if window in self.video_windows:
-                # Release video capture
-                info = self.video_windows[window]
-                if 'cap' in info:
-                    info['cap'].release()
-                
-                # Clean up temporary file if it exists
-                if 'temp_file' in info and info['temp_file'] and os.path.exists(info['temp_file']):
-                    try:
-                        os.remove(info['temp_file'])
-                        logger.info(f"Removed temporary video file: {info['temp_file']}")
-                    except Exception as e:
-                        logger.error(f"Error removing temporary video file: {e}")
-                
-                # Remove from video windows
-                del self.video_windows[window]
+            # Drop all tracking state in one step
+            rec = self._windows.pop(window, None)
+            if rec is not None and rec.listed:
+                self._listed_count -= 1
             
-            # Remove from GIF windows
-            if window in self.gif_windows:
-                del self.gif_windows[window]
-            
-            # Remove from velocity tracking
-            if window in self.window_velocities:
-                del self.window_velocities[window]
-            
-            # Remove from creation time tracking
-            if window in self.window_creation_times:
-                del self.window_creation_times[window]
-            
-            # Remove from monitor tracking
-            if window in self.window_monitors:
-                del self.window_monitors[window]
+            # Check if this is a video window
+            if rec is not None and rec.kind == 'video' and rec.info:
+                # Release video capture and temp file on the worker thread,
+                # since backend release can block the Tk event loop
+                cap = rec.info.get('cap')
+                temp_file = rec.info.get('temp_file')
+                if cap is not None or temp_file:
+                    if self._release_pool is None:
+                        self._release_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='cap-release')
+                    self._release_pool.submit(self._release_video_resources, cap, temp_file)
             
-            # Remove from current windows
-            if window in self.current_windows:
-                self.current_windows.remove(window)
+            # Windows created by the image loader are hidden and recycled instead of
+            # destroyed, so the next image popup skips creating a new Toplevel
+            if rec is not None and rec.kind == 'image' and self._recycle_window(window):
+                return
             
-            # Destroy window if it still exists
-            try:
-                if window.winfo_exists():
-                    window.destroy()
-            except Exception as e:
-                logger.error(f"Error destroying window: {e}")
+            # Destroy window - a no-op for windows that are already gone
+            window.destroy()
                 
         except tk.TclError:
             # Window already destroyed
             pass
-        except Exception as e:
-            logger.error(f"Error removing window: {e}\n{traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error removing window")
+    
+    def _recycle_window(self, window):
+        """Return a plain image window to the image loader's window pool"""
+        # Pooled windows must not keep bouncing, even if a record is recreated for them
+        self.clear_velocity(window)
+        image_loader = getattr(self.display, 'image_loader', None)
+        if image_loader is None or not self.display.running:
+            return False
+        return image_loader._return_window_to_pool(window)
+    
+    def _release_video_resources(self, cap, temp_file):
+        """Release a video capture and remove its temp file (runs on the release worker)"""
+        if cap is not None:
+            # Same lock the video loader holds around its VideoCapture calls
+            video_loader = getattr(self.display, 'video_loader', None)
+            lock = getattr(video_loader, 'video_capture_lock', None)
+            try:
+                if lock is not None:
+                    with lock:
+                        cap.release()
+                else:
+                    cap.release()
+            except Exception as e:
+                logger.error(f"Error releasing video capture: {e}")
+        
+        # Clean up temporary file if it exists
+        if temp_file and os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+                logger.info(f"Removed temporary video file: {temp_file}")
+            except Exception as e:
+                logger.error(f"Error removing temporary video file: {e}")
+    
+    def shutdown_release_pool(self):
+        """Stop the release worker once its queued releases are done"""
+        pool, self._release_pool = self._release_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
     
     def remove_window_safely(self, window):
         """Safely remove a window after its display time has elapsed"""
@@ -237,28 +343,26 @@ class WindowManager:
                 return
                 
             # Check if window still exists in our tracking lists
-            if (window not in self.current_windows and 
-                window not in self.video_windows and 
-                window not in self.gif_windows):
+            if window not in self._windows:
                 logger.info("Window already removed from tracking")
                 return
                 
             # Remove the window
             self.remove_window(window)
             
-        except Exception as e:
-            logger.error(f"Error removing window after delay: {e}\n{traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error removing window after delay")
             # Try one more time with basic approach
             try:
-                if window.winfo_exists():
-                    window.destroy()
-            except:
-                pass
+                window.destroy()
+            except (tk.TclError, AttributeError) as e:
+                logger.error("Error destroying window after failed removal: %s", e)
     
     def remove_after_delay(self, window):
         """No longer removes windows after delay - popups remain until replaced or manually closed"""
-        logger.info("Auto-closing disabled - window will remain until replaced or manually closed")
-        # No auto-close functionality - windows remain until manually closed or replaced
+        # No auto-close functionality - windows remain until manually closed or replaced,
+        # so nothing is scheduled here (no timer thread or after() callback per window)
+        logger.debug("Auto-closing disabled - window will remain until replaced or manually closed")
     
     def clear_windows(self):
         """Clear all windows using safe methods"""
@@ -266,33 +370,22 @@ class WindowManager:
             logger.info("Clearing all windows...")
             
             # Save references to all windows
-            windows_to_close = []
-            for window_dict in [self.gif_windows, self.video_windows]:
-                windows_to_close.extend(list(window_dict.keys()))
-            windows_to_close.extend(list(self.current_windows))
+            windows_to_close = [window for window, _ in list(self._windows.items())]
             
-            # Close windows safely one by one
+            # Close windows one by one - destroy() on an already destroyed
+            # window is a no-op, so no existence probe or withdraw is needed
             for window in windows_to_close:
                 try:
-                    if hasattr(window, 'winfo_exists') and window.winfo_exists():
-                        # Hide window first
-                        window.withdraw()
-                        # Then destroy it
-                        window.destroy()
+                    window.destroy()
                 except Exception as e:
                     logger.error(f"Error safely closing window: {e}")
             
-            # Clear tracking dictionaries
-            self.gif_windows.clear()
-            self.video_windows.clear()
-            self.current_windows.clear()
-            self.window_velocities.clear()
-            self.window_creation_times.clear()
-            self.window_monitors.clear()
+            # Clear tracking records
+            self.reset_tracking()
             
             logger.info("All windows cleared successfully")
-        except Exception as e:
-            logger.error(f"Error clearing windows: {e}\n{traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error clearing windows")
     
     def force_close_all(self):
         """Emergency force close of all popup windows"""
@@ -302,13 +395,8 @@ class WindowManager:
             # CRITICAL FIX: Get a copy of window lists to avoid modification during iteration
             windows_to_close = []
             try:
-                # Collect all windows from all tracking collections
-                if hasattr(self, 'gif_windows'):
-                    windows_to_close.extend(list(self.gif_windows.keys()))
-                if hasattr(self, 'video_windows'):
-                    windows_to_close.extend(list(self.video_windows.keys()))
-                if hasattr(self, 'current_windows'):
-                    windows_to_close.extend(list(self.current_windows))
+                # Collect all tracked windows
+                windows_to_close = [window for window, _ in list(self._windows.items())]
                 
                 # Log the number of windows to close
                 logger.info(f"Found {len(windows_to_close)} windows to force close")
@@ -317,31 +405,24 @@ class WindowManager:
             
             # CRITICAL FIX: First clear all velocities to prevent animation updates
             try:
-                if hasattr(self, 'window_velocities'):
-                    self.window_velocities.clear()
-                    logger.info("Cleared window velocities")
+                self.clear_velocities()
+                logger.info("Cleared window velocities")
             except Exception as e:
                 logger.error(f"Error clearing window velocities: {e}")
             
             # CRITICAL FIX: Close all windows immediately without update_idletasks
             for window in windows_to_close:
                 try:
-                    if hasattr(window, 'winfo_exists') and window.winfo_exists():
-                        # Force destroy with error handling
-                        try:
-                            # CRITICAL FIX: Use destroy() directly without withdraw
-                            logger.debug(f"Destroying window {window}")
-                            window.destroy()
-                        except Exception as e:
-                            logger.error(f"Error destroying window: {e}")
-                            # Last resort: try to withdraw then destroy
-                            try:
-                                window.withdraw()
-                                window.destroy()
-                            except Exception as e2:
-                                logger.error(f"Error in fallback window destruction: {e2}")
+                    # CRITICAL FIX: Use destroy() directly without withdraw or an existence probe
+                    window.destroy()
                 except Exception as e:
-                    logger.error(f"Error checking window existence: {e}")
+                    logger.error(f"Error destroying window: {e}")
+                    # Last resort: try to withdraw then destroy
+                    try:
+                        window.withdraw()
+                        window.destroy()
+                    except Exception as e2:
+                        logger.error(f"Error in fallback window destruction: {e2}")
             
             # CRITICAL FIX: Force update to ensure windows are closed
             try:
@@ -350,75 +431,17 @@ class WindowManager:
             except Exception as e:
                 logger.error(f"Error updating parent: {e}")
             
-            # CRITICAL FIX: Clear tracking dictionaries after destroying windows
-            try:
-                # Clear all collections
-                if hasattr(self, 'gif_windows'):
-                    self.gif_windows.clear()
-                if hasattr(self, 'video_windows'):
-                    self.video_windows.clear()
-                if hasattr(self, 'current_windows'):
-                    self.current_windows.clear()
-                if hasattr(self, 'window_velocities'):
-                    self.window_velocities.clear()
-                if hasattr(self, 'window_creation_times'):
-                    self.window_creation_times.clear()
-                if hasattr(self, 'window_monitors'):
-                    self.window_monitors.clear()
-                
-                # Reset currently_displayed counter in the display
-                if hasattr(self.display, 'currently_displayed'):
-                    self.display.currently_displayed = 0
-                
-                logger.info(f"Cleared all window tracking collections")
-            except Exception as e:
-                logger.error(f"Error clearing window collections: {e}")
-            
-            # CRITICAL FIX: Verify all windows are closed
-            window_count = 0
-            if hasattr(self, 'current_windows'):
-                window_count += len(self.current_windows)
-            if hasattr(self, 'gif_windows'):
-                window_count += len(self.gif_windows)
-            if hasattr(self, 'video_windows'):
-                window_count += len(self.video_windows)
+            # CRITICAL FIX: Clear tracking records after destroying windows
+            self.reset_tracking()
             
-            if window_count > 0:
-                logger.warning(f"Still have {window_count} windows after cleanup, resetting collections")
-                # Reset all collections as a last resort
-                if hasattr(self, 'gif_windows'):
-                    self.gif_windows = {}
-                if hasattr(self, 'video_windows'):
-                    self.video_windows = {}
-                if hasattr(self, 'current_windows'):
-                    self.current_windows = []
-                if hasattr(self, 'window_velocities'):
-                    self.window_velocities = {}
-                if hasattr(self, 'window_creation_times'):
-                    self.window_creation_times = {}
-                if hasattr(self, 'window_monitors'):
-                    self.window_monitors = {}
-                if hasattr(self.display, 'currently_displayed'):
-                    self.display.currently_displayed = 0
+            # Reset currently_displayed counter in the display
+            if hasattr(self.display, 'currently_displayed'):
+                self.display.currently_displayed = 0
             
             logger.info(f"Emergency force close completed ({len(windows_to_close)} windows)")
         except Exception as e:
             logger.error(f"Unexpected error in force_close_all: {e}")
             # CRITICAL FIX: Last resort cleanup
-            try:
-                if hasattr(self, 'gif_windows'):
-                    self.gif_windows = {}
-                if hasattr(self, 'video_windows'):
-                    self.video_windows = {}
-                if hasattr(self, 'current_windows'):
-                    self.current_windows = []
-                if hasattr(self, 'window_velocities'):
-                    self.window_velocities = {}
-                if hasattr(self, 'window_creation_times'):
-                    self.window_creation_times = {}
-                if hasattr(self, 'window_monitors'):
-                    self.window_monitors = {}
-                if hasattr(self.display, 'currently_displayed'):
-                    self.display.currently_displayed = 0
-            except Exception as e2:
-                logger.error(f"Error in last resort cleanup: {e2}") 
\ No newline at end of file
+            self.reset_tracking()
+            if hasattr(self.display, 'currently_displayed'):
+                self.display.currently_displayed = 0
@@ -2,37 +2,64 @@ import os
 import zipfile
 import json
 import logging
+import threading
 from pathlib import Path
-import traceback
+from types import MappingProxyType
+from media.path_utils import MediaPathManager
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for config (de)serialization, falling back to the stdlib
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+def _loads_config(data):
+    """Parse config file bytes"""
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_config(config):
+    """Serialize the config to bytes for a single write"""
+    if HAVE_ORJSON:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=4).encode('utf-8')
+
 class MediaManager:
+    # Read-only template for the default display settings, copied on demand
+    _DEFAULT_DISPLAY_SETTINGS = MappingProxyType({
+        'interval': 0.1,
+        'max_popups': 25,
+        'popup_probability': 5,
+        'panic_key': "'",
+        'active_monitors': (0,),
+        'bounce_enabled': False
+    })
+    
     def __init__(self, models_dir, auto_load=False):
         self.models_dir = models_dir
         self.available_zips = {}  # Dictionary of available zip files
         self.loaded_zips = set()  # Set of currently loaded zip files
-        self.config_file = os.path.join(os.path.dirname(models_dir), 'assets', 'config.json')
-        
-       # Create assets directory if it doesn't exist
-        assets_dir = os.path.dirname(self.config_file)
-        os.makedirs(assets_dir, exist_ok=True)
+        assets_dir = Path(models_dir).parent / 'assets'
+        self.config_file = str(assets_dir / 'config.json')
         
-        # Set up media directories inside assets folder
-        self.gif_dir = os.path.join(assets_dir, 'resources', 'img')
-        self.video_dir = os.path.join(assets_dir, 'resources', 'vid')
-        os.makedirs(self.gif_dir, exist_ok=True)
-        os.makedirs(self.video_dir, exist_ok=True)
+        # Set up media directories inside assets folder (creating them also creates assets)
+        resources_dir = assets_dir / 'resources'
+        gif_dir = resources_dir / 'img'
+        video_dir = resources_dir / 'vid'
+        gif_dir.mkdir(parents=True, exist_ok=True)
+        video_dir.mkdir(parents=True, exist_ok=True)
+        self.gif_dir = str(gif_dir)
+        self.video_dir = str(video_dir)
         
-        # Default display settings
-        self.display_settings = {
-            'interval': 0.1,
-            'max_popups': 25,
-            'popup_probability': 5,
-            'panic_key': "'",
-            'active_monitors': None,  # Default to None means all monitors
-            'bounce_enabled': False
-        }
+        # Debounced config writes: bursts of load/unload calls collapse into one save
+        self._save_lock = threading.RLock()
+        self._save_timer = None
+        self._pending_data = None  # Config serialized when the save was scheduled
+        self.save_delay = 0.2  # seconds
         
         # Load saved configuration (but not the models yet)
         self.load_config()
@@ -43,8 +70,9 @@ class MediaManager:
         else:
             # Just scan for available zips without loading them
             self._scan_available_zips()
+            self._reconcile_loaded_zips()
             
-        logger.info(f"MediaManager initialized with models directory: {models_dir}")
+        logger.info("MediaManager initialized with models directory: %s", models_dir)
     
     def _scan_available_zips(self):
         """Scan for available zip and gmodel files without loading them"""
@@ -52,56 +80,47 @@ class MediaManager:
             # Clear existing zips
             self.available_zips.clear()
             
-            # First, collect all files with their extensions
-            all_model_files = {}
+            # Preferred (filename, path) per base name, built in a single pass
+            winners = {}
+            gmodel_bases = set()
             
             if os.path.exists(self.models_dir):
-                for filename in os.listdir(self.models_dir):
-                    # Only process .zip and .gmodel files
-                    if filename.lower().endswith(('.zip', '.gmodel')):
-                        # Get the base name without extension
-                        base_name = os.path.splitext(filename)[0]
+                # scandir entries carry the name and full path, so no extra joins are needed
+                with os.scandir(self.models_dir) as entries:
+                    for entry in entries:
+                        filename = entry.name
                         
-                        # Get file path
-                        file_path = os.path.join(self.models_dir, filename)
+                        # Split the name once into base name and extension
+                        head, sep, ext = filename.rpartition('.')
+                        base_name = head if sep else filename
+                        extension = '.' + ext.lower() if sep else ''
                         
-                        # Add or update the file info
-                        if base_name not in all_model_files:
-                            all_model_files[base_name] = {
-                                'path': file_path,
-                                'filename': filename,
-                                'extension': os.path.splitext(filename)[1].lower()
-                            }
-                        else:
-                            # If both .zip and .gmodel exist, prefer .gmodel
-                            current_ext = all_model_files[base_name]['extension']
-                            new_ext = os.path.splitext(filename)[1].lower()
-                            
-                            # .gmodel takes precedence over .zip
-                            if new_ext == '.gmodel' and current_ext == '.zip':
-                                all_model_files[base_name] = {
-                                    'path': file_path,
-                                    'filename': filename,
-                                    'extension': new_ext
-                                }
+                        # Only process .zip and .gmodel files
+                        if extension not in ('.zip', '.gmodel') or not entry.is_file():
+                            continue
+                        
+                        # If both .zip and .gmodel exist, prefer .gmodel
+                        if extension == '.gmodel':
+                            if base_name not in gmodel_bases:
+                                gmodel_bases.add(base_name)
+                                winners[base_name] = (filename, entry.path)
+                        elif base_name not in winners:
+                            winners[base_name] = (filename, entry.path)
             
-            # Now build available_zips using only the preferred file for each base name
-            for file_info in all_model_files.values():
-                filename = file_info['filename']
-                file_path = file_info['path']
-                self.available_zips[filename] = file_path
+            # Build available_zips from the preferred file for each base name
+            self.available_zips.update(winners.values())
             
-            logger.info(f"Found {len(self.available_zips)} model files")
+            logger.info("Found %d model files", len(self.available_zips))
             
         except Exception as e:
-            logger.error(f"Error scanning available model files: {e}\n{traceback.format_exc()}")
+            logger.exception("Error scanning available model files")
     
     def load_config(self):
         """Load configuration from file"""
         try:
             # Check if config file exists
             if not os.path.exists(self.config_file):
-                logger.info(f"Config file {self.config_file} not found, using defaults")
+                logger.info("Config file %s not found, using defaults", self.config_file)
                 self.config = {
                     'loaded_zips': [],
                     'display_settings': self._get_default_display_settings()
@@ -109,8 +128,7 @@ class MediaManager:
                 return True
                 
             # Load config from file
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
+            self.config = _loads_config(Path(self.config_file).read_bytes())
                 
             # Ensure required sections exist
             if 'loaded_zips' not in self.config:
@@ -125,39 +143,22 @@ class MediaManager:
                 
                 # Remove any 'enabled_monitors' key if it exists
                 if 'enabled_monitors' in display_settings:
-                    logger.warning(f"Found deprecated 'enabled_monitors' key in config, removing it")
+                    logger.warning("Found deprecated 'enabled_monitors' key in config, removing it")
                     del display_settings['enabled_monitors']
                 
                 # Ensure active_monitors is present and valid
                 if 'active_monitors' not in display_settings or not display_settings['active_monitors']:
                     display_settings['active_monitors'] = [0]  # Default to primary monitor
-                elif not isinstance(display_settings['active_monitors'], list):
-                    display_settings['active_monitors'] = [int(display_settings['active_monitors'])]
                 else:
-                    # Convert each element to int
-                    display_settings['active_monitors'] = [int(idx) for idx in display_settings['active_monitors']]
-                    
-                logger.info(f"Loaded config with active_monitors: {display_settings['active_monitors']}")
-                print(f"DEBUG CONFIG: Loaded config with active_monitors: {display_settings['active_monitors']}")
-            
-            # Load zip files from config and store them
-            saved_loaded_zips = self.config.get('loaded_zips', [])
-            
-            # Scan available zips first to ensure we have the latest list
-            self._scan_available_zips()
+                    display_settings['active_monitors'] = self._normalize_monitors(display_settings['active_monitors'])
             
-            # Only load zips that actually exist in the available zips
-            self.loaded_zips = set()
-            for zip_name in saved_loaded_zips:
-                if zip_name in self.available_zips:
-                    self.loaded_zips.add(zip_name)
-                else:
-                    logger.warning(f"Saved zip {zip_name} not found in available zips, skipping")
-            
-            logger.info(f"Loaded configuration with {len(self.loaded_zips)} saved models and display settings")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Loaded configuration with %d saved models and active_monitors: %s",
+                            len(self.config['loaded_zips']),
+                            self.config.get('display_settings', {}).get('active_monitors'))
             return True
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             # Use defaults
             self.config = {
                 'loaded_zips': [],
@@ -165,32 +166,82 @@ class MediaManager:
             }
             return False
     
+    def _reconcile_loaded_zips(self):
+        """Load the zips saved in config that exist in the last scan of available zips"""
+        saved_zips = set(self.config.get('loaded_zips', []))
+        self.loaded_zips = saved_zips & self.available_zips.keys()
+        for zip_name in saved_zips - self.loaded_zips:
+            logger.warning("Saved zip %s not found in available zips, skipping", zip_name)
+    
+    def _serialize_config(self):
+        """Serialize the config on the thread that mutates it (caller holds _save_lock)"""
+        # Update loaded_zips in config
+        self.config['loaded_zips'] = list(self.loaded_zips)
+        return _dumps_config(self.config)
+    
+    def _schedule_save(self, delay=None):
+        """Schedule a config save, restarting the delay if one is already pending"""
+        with self._save_lock:
+            # Serialize now so the timer thread only writes bytes and never reads
+            # config/loaded_zips while the Tk thread is changing them
+            self._pending_data = self._serialize_config()
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            if delay is None:
+                delay = self.save_delay
+            self._save_timer = threading.Timer(delay, self.flush_config)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush_config(self):
+        """Write a pending scheduled save immediately (call on shutdown)"""
+        with self._save_lock:
+            if self._save_timer is None:
+                return True
+            self._save_timer.cancel()
+            self._save_timer = None
+            data, self._pending_data = self._pending_data, None
+            return self._write_config(data)
+    
     def save_config(self):
         """Save configuration to file"""
+        with self._save_lock:
+            # A direct save covers any pending scheduled save
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._pending_data = None
+            try:
+                data = self._serialize_config()
+            except Exception:
+                logger.exception("Error serializing configuration")
+                return False
+            return self._write_config(data)
+    
+    def _write_config(self, data):
+        """Write serialized config bytes to the config file (caller holds _save_lock)"""
+        # Write to a temporary file and swap it in so the config is never left half-written
+        tmp_file = self.config_file + '.tmp'
         try:
             # Ensure config directory exists
             config_dir = os.path.dirname(self.config_file)
             os.makedirs(config_dir, exist_ok=True)
             
-            # Update loaded_zips in config
-            self.config['loaded_zips'] = list(self.loaded_zips)
-            
-            # Log what we're saving
-            logger.info(f"Saving config with {len(self.loaded_zips)} loaded zips: {', '.join(self.loaded_zips)}")
-            
-            if 'display_settings' in self.config:
-                active_monitors = self.config['display_settings'].get('active_monitors', [0])
-                logger.info(f"Saving config with active_monitors: {active_monitors}")
-                print(f"DEBUG CONFIG: Saving config with active_monitors: {active_monitors}")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
             
-            # Save config to file
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
-                
-            logger.info(f"Saved configuration to {self.config_file}")
+            logger.info("Saved configuration to %s (%d bytes)", self.config_file, len(data))
             return True
-        except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
+        except Exception:
+            logger.exception("Error saving configuration")
+            # Don't leave a partial temp file behind
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return False
     
     def get_display_settings(self):
@@ -206,87 +257,73 @@ class MediaManager:
                 
             # Ensure active_monitors is a list of integers
             if 'active_monitors' in settings:
-                # Convert to list if it's not already
-                if not isinstance(settings['active_monitors'], list):
-                    settings['active_monitors'] = [int(settings['active_monitors'])]
-                else:
-                    # Convert each element to int
-                    settings['active_monitors'] = [int(idx) for idx in settings['active_monitors']]
+                settings['active_monitors'] = self._normalize_monitors(settings['active_monitors'])
                     
-                logger.info(f"Retrieved display settings with active_monitors: {settings['active_monitors']}")
-                print(f"DEBUG SETTINGS: Retrieved active_monitors: {settings['active_monitors']}")
+                logger.debug("Retrieved display settings with active_monitors: %s", settings['active_monitors'])
             else:
                 # Default to primary monitor
                 settings['active_monitors'] = [0]
-                logger.info("No active_monitors in settings, defaulting to primary monitor")
-                print("DEBUG SETTINGS: No active_monitors in settings, defaulting to primary monitor")
+                logger.debug("No active_monitors in settings, defaulting to primary monitor")
                 
             return settings
         except Exception as e:
-            logger.error(f"Error getting display settings: {e}")
+            logger.error("Error getting display settings: %s", e)
             return self._get_default_display_settings()
             
-    def update_display_settings(self, settings):
-        """Update display settings in config"""
+    def update_display_settings(self, settings, defer=False):
+        """Update display settings in config, optionally writing it from the save timer"""
         try:
             if not self.config:
                 self.load_config()
                 
             # Validate settings
             if not isinstance(settings, dict):
-                logger.error(f"Invalid settings type: {type(settings)}")
+                logger.error("Invalid settings type: %s", type(settings))
                 return False
                 
             # Ensure active_monitors is a list of integers
             if 'active_monitors' in settings:
-                # Convert to list if it's not already
-                if not isinstance(settings['active_monitors'], list):
-                    settings['active_monitors'] = [int(settings['active_monitors'])]
-                else:
-                    # Convert each element to int
-                    settings['active_monitors'] = [int(idx) for idx in settings['active_monitors']]
+                settings['active_monitors'] = self._normalize_monitors(settings['active_monitors'])
                     
-                logger.info(f"Set active_monitors to: {settings['active_monitors']}")
-                print(f"DEBUG SETTINGS: Setting active_monitors to: {settings['active_monitors']}")
+                logger.info("Set active_monitors to: %s", settings['active_monitors'])
                 
             # Update config
             self.config['display_settings'] = settings
             
-            # Save config
-            self.save_config()
+            # Save config. Deferred callers have already coalesced their changes,
+            # so the timer fires right away and only moves the write off their thread
+            if defer:
+                self._schedule_save(delay=0)
+            else:
+                self.save_config()
             
             return True
         except Exception as e:
-            logger.error(f"Error updating display settings: {e}")
+            logger.error("Error updating display settings: %s", e)
             return False
     
     def refresh_media_files(self):
         """Refresh the list of available model files (.zip and .gmodel)"""
         try:
-            # Store current loaded zips
-            current_loaded = self.loaded_zips.copy()
-            
             # Scan for available model files
             self._scan_available_zips()
             
             # Filter loaded zips to only those that are still available
-            self.loaded_zips = {zip_name for zip_name in self.loaded_zips if zip_name in self.available_zips}
+            self.loaded_zips &= self.available_zips.keys()
             
             # If no models are loaded after filtering, try to restore from config
             if not self.loaded_zips and 'loaded_zips' in self.config:
-                for zip_name in self.config.get('loaded_zips', []):
-                    if zip_name in self.available_zips:
-                        self.loaded_zips.add(zip_name)
-                logger.info(f"Restored {len(self.loaded_zips)} model files from config")
+                self._reconcile_loaded_zips()
+                logger.info("Restored %d model files from config", len(self.loaded_zips))
             
             # Save the configuration to ensure it's up to date
             self.config['loaded_zips'] = list(self.loaded_zips)
             self.save_config()
             
-            logger.info(f"Refreshed media files: {len(self.available_zips)} available, {len(self.loaded_zips)} loaded")
+            logger.info("Refreshed media files: %d available, %d loaded", len(self.available_zips), len(self.loaded_zips))
             
         except Exception as e:
-            logger.error(f"Error refreshing media files: {e}\n{traceback.format_exc()}")
+            logger.exception("Error refreshing media files")
     
     def get_media_paths(self):
         """Get all media paths from loaded model files"""
@@ -302,49 +339,44 @@ class MediaManager:
                 logger.warning("No model files are currently loaded")
                 return media_paths
                 
-            logger.info(f"Getting media paths from {len(self.loaded_zips)} loaded model files: {', '.join(self.loaded_zips)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Getting media paths from %d loaded model files: %s",
+                            len(self.loaded_zips), ', '.join(self.loaded_zips))
             
-            # Process each loaded model file
-            for zip_name in self.loaded_zips:
-                if zip_name in self.available_zips:
-                    zip_path = self.available_zips[zip_name]
-                    logger.info(f"Processing model file: {zip_path}")
+            # Only use loaded model files that are still available
+            selected_zips = self.loaded_zips & self.available_zips.keys()
+            for zip_name in self.loaded_zips - selected_zips:
+                logger.warning("Model file %s not found in available models", zip_name)
+            
+            # Process all selected model files with one path manager and one directory walk
+            if selected_zips:
+                try:
+                    paths = MediaPathManager().get_media_paths(selected_zips)
                     
-                    # Process zip file to extract media paths
-                    try:
-                        from media.path_utils import MediaPathManager
-                        path_manager = MediaPathManager()
-                        
-                        # Pass only the currently processing zip to get_media_paths
-                        paths = path_manager.get_media_paths({zip_name})
-                        
-                        # Add paths to the main list
-                        media_paths['images'].extend(paths.get('images', []))
-                        media_paths['gifs'].extend(paths.get('gifs', []))
-                        media_paths['videos'].extend(paths.get('videos', []))
-                        
-                    except Exception as e:
-                        logger.error(f"Error getting media paths from {zip_path}: {e}\n{traceback.format_exc()}")
-                else:
-                    logger.warning(f"Model file {zip_name} not found in available models")
+                    # Add paths to the main list
+                    media_paths['images'].extend(paths.get('images', []))
+                    media_paths['gifs'].extend(paths.get('gifs', []))
+                    media_paths['videos'].extend(paths.get('videos', []))
+                    
+                except Exception as e:
+                    logger.exception("Error getting media paths from model files")
             
-            logger.info(f"Found {len(media_paths['images'])} images, {len(media_paths['gifs'])} GIFs, and {len(media_paths['videos'])} videos")
+            logger.info("Found %d images, %d GIFs, and %d videos",
+                        len(media_paths['images']), len(media_paths['gifs']), len(media_paths['videos']))
             
             # Log sample paths for debugging
-            if media_paths['images']:
-                sample_count = min(3, len(media_paths['images']))
-                logger.info(f"Sample image paths: {media_paths['images'][:sample_count]}")
-            if media_paths['gifs']:
-                sample_count = min(3, len(media_paths['gifs']))
-                logger.info(f"Sample GIF paths: {media_paths['gifs'][:sample_count]}")
-            if media_paths['videos']:
-                sample_count = min(3, len(media_paths['videos']))
-                logger.info(f"Sample video paths: {media_paths['videos'][:sample_count]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                if media_paths['images']:
+                    logger.debug("Sample image paths: %s", media_paths['images'][:3])
+                if media_paths['gifs']:
+                    logger.debug("Sample GIF paths: %s", media_paths['gifs'][:3])
+                if media_paths['videos']:
+                    logger.debug("Sample video paths: %s", media_paths['videos'][:3])
                 
             return media_paths
             
         except Exception as e:
-            logger.error(f"Error getting media paths: {e}\n{traceback.format_exc()}")
+            logger.exception("Error getting media paths")
             return media_paths
     
     def get_loaded_zips(self):
@@ -361,26 +393,26 @@ class MediaManager:
             if zip_name in self.available_zips:
                 # Check if the zip is already loaded
                 if zip_name in self.loaded_zips:
-                    logger.info(f"Zip file already loaded: {zip_name}")
+                    logger.info("Zip file already loaded: %s", zip_name)
                     return True
                 
                 # Add to loaded zips
                 self.loaded_zips.add(zip_name)
                 
-                # Save configuration after loading
-                self.save_config()
+                # Schedule a (debounced) config save after loading
+                self._schedule_save()
                 
                 # Notify any listeners that media files have changed
                 if hasattr(self, 'on_media_changed') and self.on_media_changed:
                     self.on_media_changed()
                 
-                logger.info(f"Loaded zip file: {zip_name}")
+                logger.info("Loaded zip file: %s", zip_name)
                 return True
             else:
-                logger.warning(f"Attempted to load non-existent zip: {zip_name}")
+                logger.warning("Attempted to load non-existent zip: %s", zip_name)
                 return False
         except Exception as e:
-            logger.error(f"Error loading zip {zip_name}: {e}\n{traceback.format_exc()}")
+            logger.exception("Error loading zip %s", zip_name)
             return False
     
     def unload_zip(self, zip_name):
@@ -388,36 +420,38 @@ class MediaManager:
         try:
             # Check if the zip is actually loaded
             if zip_name not in self.loaded_zips:
-                logger.info(f"Zip file not loaded, nothing to unload: {zip_name}")
+                logger.info("Zip file not loaded, nothing to unload: %s", zip_name)
                 return True
             
             # Remove from loaded zips
             self.loaded_zips.discard(zip_name)
             
-            # Save configuration after unloading
-            self.save_config()
+            # Schedule a (debounced) config save after unloading
+            self._schedule_save()
             
             # Notify any listeners that media files have changed
             if hasattr(self, 'on_media_changed') and self.on_media_changed:
                 self.on_media_changed()
             
-            logger.info(f"Unloaded zip file: {zip_name}")
+            logger.info("Unloaded zip file: %s", zip_name)
             return True
         except Exception as e:
-            logger.error(f"Error unloading zip {zip_name}: {e}\n{traceback.format_exc()}")
+            logger.exception("Error unloading zip %s", zip_name)
             return False
     
     def set_on_media_changed_callback(self, callback):
         """Set a callback to be called when media files change"""
         self.on_media_changed = callback
 
+    @staticmethod
+    def _normalize_monitors(monitors):
+        """Coerce an active_monitors value to a list of ints"""
+        if isinstance(monitors, (list, tuple)):
+            return list(map(int, monitors))
+        return [int(monitors)]
+
     def _get_default_display_settings(self):
-        """Get default display settings"""
-        return {
-            'interval': 0.1,
-            'max_popups': 25,
-            'popup_probability': 5,
-            'panic_key': "'",
-            'active_monitors': [0],
-            'bounce_enabled': False
-        }
+        """Get a mutable copy of the default display settings"""
+        settings = dict(self._DEFAULT_DISPLAY_SETTINGS)
+        settings['active_monitors'] = list(settings['active_monitors'])
+        return settings
@@ -4,13 +4,14 @@ def handle_panic(self, *args, **kwargs):
     if hasattr(self, 'is_panic_disabled') and self.is_panic_disabled:
         logger.info("Panic action blocked - currently disabled during key remapping")
         return False
-        
+
     logger.info("Handling panic action")
-    self.withdraw()
-    
-    # Also hide any top level windows
-    for window in self.winfo_children():
-        if isinstance(window, tk.Toplevel):
-            window.withdraw()
-            
-    return True 
\ No newline at end of file
+
+    # Hide this window and every mapped toplevel under it. Tk reports the mapped
+    # toplevels in one call, so there is no need to walk and type-check all children.
+    call = self.tk.call
+    for window in self.tk.splitlist(call('wm', 'stackorder', self._w)):
+        call('wm', 'withdraw', window)
+    call('wm', 'withdraw', self._w)
+
+    return True
@@ -2,9 +2,54 @@ import tkinter as tk
 from tkinter import ttk
 import keyboard
 import logging
+import threading
+import queue
 
 logger = logging.getLogger(__name__)
 
+# Tcl interpreter the panel styles were last configured in (styles are global per interpreter)
+_styled_interp = None
+
+def _init_styles(master):
+    """Configure the panel's ttk styles once per Tk interpreter"""
+    global _styled_interp
+    if _styled_interp is master.tk:
+        return
+    style = ttk.Style(master)
+    style.configure('Modern.TLabelframe.Label',
+                   background='#1e1e1e',
+                   foreground='white',
+                   font=('Segoe UI', 11, 'bold'))
+    style.configure('Modern.TLabelframe',
+                   background='#1e1e1e',
+                   foreground='white',
+                   bordercolor='#1e1e1e',
+                   darkcolor='#1e1e1e',
+                   lightcolor='#1e1e1e',
+                   borderwidth=0,
+                   relief='flat')
+    style.configure('Modern.Accent.TButton',
+                   background='#0078d4',
+                   foreground='black')
+    style.map('Modern.TButton',
+              background=[('active', '#606060'), ('!disabled', '#444444')],
+              foreground=[('active', 'black'), ('!disabled', 'black')])
+    
+    # Configure transparent scale style for bounce chance slider
+    style.configure('Transparent.Horizontal.TScale',
+                  background='#1e1e1e',
+                  troughcolor='#1e1e1e',
+                  lightcolor='#1e1e1e',
+                  darkcolor='#1e1e1e',
+                  slidercolor='darkorchid3')
+    _styled_interp = master.tk
+
+def _as_flag(value):
+    """Read a saved 1/0 setting; older configs may hold it as a string"""
+    if isinstance(value, str):
+        return bool(int(value))
+    return bool(value)
+
 class DisplaySettingsPanel:
     def __init__(self, parent, interval_var, max_popups_var, probability_var, on_toggle, on_panic):
         self.frame = ttk.LabelFrame(
@@ -14,6 +59,11 @@ class DisplaySettingsPanel:
             style='Modern.TLabelframe'
         )
         
+        # Cache the toplevel and the app objects it carries; they are attached before the panel is built
+        self._root = self.frame.winfo_toplevel()
+        self._media_manager = getattr(self._root, 'media_manager', None)
+        self._media_display = getattr(self._root, 'media_display', None)
+        
         self.interval = interval_var
         self.max_popups = max_popups_var
         self.probability = probability_var
@@ -27,52 +77,49 @@ class DisplaySettingsPanel:
         self.gif_prob = tk.IntVar(value=20)    # Default: 20%
         self.video_prob = tk.IntVar(value=20)  # Default: 20%
         self.currently_adjusting = None  # Track which slider is being adjusted
-        
-        # Configure styles for this panel
-        style = ttk.Style()
-        style.configure('Modern.TLabelframe.Label',
-                       background='#1e1e1e',
-                       foreground='white',
-                       font=('Segoe UI', 11, 'bold'))
-        style.configure('Modern.TLabelframe',
-                       background='#1e1e1e',
-                       foreground='white',
-                       bordercolor='#1e1e1e',
-                       darkcolor='#1e1e1e',
-                       lightcolor='#1e1e1e',
-                       borderwidth=0,
-                       relief='flat')
-        style.configure('Modern.Accent.TButton',
-                       background='#0078d4',
-                       foreground='black')
-        style.map('Modern.TButton',
-                  background=[('active', '#606060'), ('!disabled', '#444444')],
-                  foreground=[('active', 'black'), ('!disabled', 'black')])
-        
-        # Configure transparent scale style for bounce chance slider
-        style.configure('Transparent.Horizontal.TScale',
-                      background='#1e1e1e',
-                      troughcolor='#1e1e1e',
-                      lightcolor='#1e1e1e',
-                      darkcolor='#1e1e1e',
-                      slidercolor='darkorchid3')
+        self._prob_vars = {'image': self.image_prob, 'gif': self.gif_prob, 'video': self.video_prob}
+        self._last_prob_triple = None  # (image, gif, video) after the last rebalance
+        # Checked monitor indices, refreshed by _update_monitors. Seeded from the saved
+        # settings so get_active_monitors is right before _populate_monitors runs
+        self._active_monitors = [0]
+        if self._media_manager is not None:
+            self._active_monitors = list(self._media_manager.get_display_settings().get('active_monitors') or [0])
+        self._pushed_weights = None  # Media weights last sent to the media display
+        self._populate_monitors_id = None  # Pending after_idle id for _populate_monitors
+        self._startup_state_queue = queue.Queue(maxsize=1)  # Registry state from the worker thread
+        self._startup_poll_id = None  # Pending after id for _poll_startup_state
+        
+        # Last values shown by the slider labels, so repeat events with no visible change are skipped
+        self._last_bounce_int = -1
+        self._last_label_texts = {}
+        
+        # Pending after() ids for debounced callbacks, keyed by what they update
+        self._debounce_ids = {}
+        
+        # (variable, trace id) pairs for the value label traces, removed on destroy
+        self._label_traces = []
+        
+        # Flush any settings write that's still waiting when the panel goes away
+        self.frame.bind('<Destroy>', self._on_destroy, add='+')
+        
+        # Configure styles for this panel (only the first panel does any work)
+        _init_styles(self.frame)
         
         # Load saved settings
-        root = self.frame.winfo_toplevel()
-        if hasattr(root, 'media_manager'):
-            settings = root.media_manager.get_display_settings()
+        if self._media_manager is not None:
+            settings = self._media_manager.get_display_settings()
             self.interval.set(settings.get('interval', 0.1))
             self.max_popups.set(settings.get('max_popups', 25))
             self.probability.set(settings.get('popup_probability', 5))
             
             # Load bounce chance setting - if bounce_enabled is false, use 0
-            bounce_enabled = bool(int(settings.get('bounce_enabled', 0)))
+            bounce_enabled = _as_flag(settings.get('bounce_enabled', 0))
             bounce_chance = settings.get('bounce_chance', 0.0)
             # If bounce is disabled, set chance to 0
             if not bounce_enabled:
                 bounce_chance = 0.0
             self.bounce_chance.set(float(bounce_chance))
-            print(f"DEBUG INIT: Loaded bounce_chance={bounce_chance}% (enabled={bounce_enabled})")
+            logger.debug("Loaded bounce_chance=%s%% (enabled=%s)", bounce_chance, bounce_enabled)
             
             # Load media type probabilities
             self.image_prob.set(int(settings.get('image_prob', 60)))
@@ -80,13 +127,13 @@ class DisplaySettingsPanel:
             self.video_prob.set(int(settings.get('video_prob', 20)))
             
             # Apply bounce settings to media_display
-            if hasattr(root, 'media_display'):
-                root.media_display.set_bounce_enabled(bounce_enabled)
-                root.media_display.bounce_chance = float(bounce_chance) / 100.0
-                print(f"DEBUG INIT: Applied to media_display: bounce_enabled={bounce_enabled}, chance={bounce_chance}%")
+            if self._media_display is not None:
+                # Always call the setter here: MediaDisplay may have loaded the flag without starting its thread
+                self._push_bounce(bounce_enabled, float(bounce_chance), force=True)
+                logger.debug("Applied to media_display: bounce_enabled=%s, chance=%s%%", bounce_enabled, bounce_chance)
                 
                 # Apply media type probabilities
-                root.media_display.set_media_weights(
+                self._push_media_weights(
                     self.image_prob.get(),
                     self.gif_prob.get(),
                     self.video_prob.get()
@@ -100,16 +147,21 @@ class DisplaySettingsPanel:
         self._create_monitor_control()
         self._create_buttons()
         
-        # Update labels after all controls are created
+        # Update labels after all controls are created, then keep each one in sync with its variable
         self._update_labels()
+        self._label_traces = [
+            (self.interval, self.interval.trace_add('write', lambda *a: self._update_interval_label())),
+            (self.max_popups, self.max_popups.trace_add('write', lambda *a: self._update_popup_label())),
+            (self.probability, self.probability.trace_add('write', lambda *a: self._update_probability_label())),
+        ]
         
         # Bind update events to save settings
         self.interval_scale.bind("<ButtonRelease-1>", self._save_settings)
         self.popup_scale.bind("<ButtonRelease-1>", self._save_settings)
         self.probability_scale.bind("<ButtonRelease-1>", self._save_settings)
         
-        # Also update bounce settings during slider movement
-        self.bounce_chance_scale.bind("<Motion>", self._update_bounce_settings)
+        # Bounce applies live through the scale command; persist it once the drag ends
+        self.bounce_chance_scale.bind("<ButtonRelease-1>", self._flush_bounce)
     
     def _create_interval_control(self):
         # Interval label
@@ -162,10 +214,6 @@ class DisplaySettingsPanel:
             style='Modern.TLabel'
         )
         self.popup_label.grid(row=1, column=2, padx=5)
-        
-        # Bind update events
-        self.interval_scale.bind("<Motion>", self._update_labels)
-        self.popup_scale.bind("<Motion>", self._update_labels)
     
     def _create_probability_control(self):
         # Probability label
@@ -192,9 +240,6 @@ class DisplaySettingsPanel:
             style='Modern.TLabel'
         )
         self.probability_label.grid(row=2, column=2, padx=5)
-        
-        # Bind update event
-        self.probability_scale.bind("<Motion>", self._update_labels)
     
     def _create_bounce_control(self):
         """Create bounce control settings"""
@@ -233,9 +278,6 @@ class DisplaySettingsPanel:
             width=5  # Increased width to ensure % sign is fully visible
         )
         self.bounce_chance_label.grid(row=4, column=2, padx=5)
-        
-        # Bind update events
-        self.bounce_chance_scale.bind("<Motion>", self._update_bounce_settings)
     
     def _create_media_prob_control(self):
         """Create the media type probability sliders"""
@@ -293,12 +335,13 @@ class DisplaySettingsPanel:
         media_prob_frame.columnconfigure(1, weight=1)
         
         # Update the values initially
+        self._prob_labels = (self.image_label, self.gif_label, self.video_label)
         self._update_media_prob_labels()
         
         # Bind events for interactive adjustment
-        self.image_scale.bind("<B1-Motion>", lambda e: self._adjust_media_probs("image"))
-        self.gif_scale.bind("<B1-Motion>", lambda e: self._adjust_media_probs("gif"))
-        self.video_scale.bind("<B1-Motion>", lambda e: self._adjust_media_probs("video"))
+        self.image_scale.bind("<B1-Motion>", lambda e: self._on_media_prob_motion("image"))
+        self.gif_scale.bind("<B1-Motion>", lambda e: self._on_media_prob_motion("gif"))
+        self.video_scale.bind("<B1-Motion>", lambda e: self._on_media_prob_motion("video"))
         
         # Bind release events to save settings
         self.image_scale.bind("<ButtonRelease-1>", self._save_media_probs)
@@ -319,58 +362,83 @@ class DisplaySettingsPanel:
             width=7  # Fixed width to match other labels
         ).grid(row=0, column=0, sticky='w', padx=(0, 5))  # Reduced padding
         
+        # Create monitor selection area
+        self._monitor_buttons_frame = ttk.Frame(monitor_frame, style='Modern.TFrame')
+        self._monitor_buttons_frame.grid(row=0, column=1, sticky='w')
+        self.monitor_vars = {}  # monitor index -> BooleanVar, in display order
+        
+        # Add startup checkbox on same line
+        self.startup_var = tk.BooleanVar()
+        
+        # Create a separator frame
+        sep_label = ttk.Label(monitor_frame, text="|", style='Modern.TLabel')
+        sep_label.grid(row=0, column=2, padx=(10, 10))
+        
+        # Startup checkbox, more compact
+        self.startup_check = ttk.Checkbutton(
+            monitor_frame,
+            text="Run on Startup",
+            style='Modern.TCheckbutton',
+            variable=self.startup_var,
+            command=self._toggle_startup
+        )
+        self.startup_check.grid(row=0, column=3, sticky='w', padx=(0, 5))
+        
+        # Monitor enumeration and the startup registry check run once the panel has been drawn
+        self._populate_monitors_id = self.frame.after_idle(self._populate_monitors)
+
+    def _populate_monitors(self):
+        """Create the monitor checkbuttons and load the startup state"""
+        self._populate_monitors_id = None
+        
         # Get available monitors first
-        root = self.frame.winfo_toplevel()
         monitors = []
-        if hasattr(root, 'media_display'):
-            monitors = root.media_display.get_monitor_info()
-            print(f"DEBUG MONITOR_INIT: Available monitors: {monitors}")
-            logger.info(f"Available monitors: {monitors}")
+        if self._media_display is not None:
+            monitors = self._media_display.get_monitor_info()
+            logger.info("Available monitors: %s", monitors)
         
         if not monitors:
             monitors = [(0, "Primary Monitor")]
         
         # Get active monitors from settings
         active_monitors = []
-        if hasattr(root, 'media_manager'):
-            settings = root.media_manager.get_display_settings()
+        loaded_monitors = None
+        if self._media_manager is not None:
+            settings = self._media_manager.get_display_settings()
             active_monitors = settings.get('active_monitors', [0])  # Default to primary monitor
-            print(f"DEBUG MONITOR_INIT: Loaded active monitors from settings: {active_monitors}")
-            logger.info(f"Loaded active monitors from settings: {active_monitors}")
+            logger.info("Loaded active monitors from settings: %s", active_monitors)
+            loaded_monitors = list(active_monitors)
             
             # Validate active_monitors against available monitors
+            available = {m_idx for m_idx, _ in monitors}
             valid_active_monitors = []
             for idx in active_monitors:
-                if any(m_idx == idx for m_idx, _ in monitors):
+                if idx in available:
                     valid_active_monitors.append(idx)
                 else:
-                    logger.warning(f"Monitor index {idx} from settings not found in available monitors")
+                    logger.warning("Monitor index %s from settings not found in available monitors", idx)
             
             # If no valid monitors, default to primary
             if not valid_active_monitors and monitors:
                 valid_active_monitors = [monitors[0][0]]
-                logger.info(f"No valid monitors from settings, defaulting to {valid_active_monitors}")
+                logger.info("No valid monitors from settings, defaulting to %s", valid_active_monitors)
                 
             active_monitors = valid_active_monitors
             
-        # Create monitor selection area
-        monitor_buttons_frame = ttk.Frame(monitor_frame, style='Modern.TFrame')
-        monitor_buttons_frame.grid(row=0, column=1, sticky='w')
-        
         # Create checkbuttons for monitors
-        self.monitor_vars = []
+        active_set = set(active_monitors)
         for i, (idx, name) in enumerate(monitors):
             # Set initial state based on saved settings or default to primary monitor
-            is_active = idx in active_monitors
+            is_active = idx in active_set
             var = tk.BooleanVar(value=is_active)
-            self.monitor_vars.append((idx, var))
+            self.monitor_vars[idx] = var
             
             # Create more compact monitor names
             display_name = f"#{idx+1}"  # Just show monitor number
             
             # Create the checkbutton
             monitor_cb = ttk.Checkbutton(
-                monitor_buttons_frame,
+                self._monitor_buttons_frame,
                 text=display_name,
                 variable=var,
                 style='Modern.TCheckbutton',
@@ -379,93 +447,64 @@ class DisplaySettingsPanel:
             monitor_cb.grid(row=0, column=i, sticky='w', padx=(0, 5))
             
             # Log the monitor checkbutton creation
-            print(f"DEBUG MONITOR_INIT: Created monitor checkbutton for monitor {idx} (active: {is_active})")
-            logger.info(f"Created monitor checkbutton for monitor {idx} (active: {is_active})")
-        
-        # Add startup checkbox on same line
-        self.startup_var = tk.BooleanVar()
-        
-        # Create a separator frame
-        sep_label = ttk.Label(monitor_frame, text="|", style='Modern.TLabel')
-        sep_label.grid(row=0, column=2, padx=(10, 10))
-        
-        # Startup checkbox, more compact
-        self.startup_check = ttk.Checkbutton(
-            monitor_frame,
-            text="Run on Startup",
-            style='Modern.TCheckbutton',
-            variable=self.startup_var,
-            command=self._toggle_startup
-        )
-        self.startup_check.grid(row=0, column=3, sticky='w', padx=(0, 5))
+            logger.debug("Created monitor checkbutton for monitor %s (active: %s)", idx, is_active)
         
         # Set initial state from settings or registry
         startup_enabled = False
         
         # First try to load from settings
-        if hasattr(root, 'media_manager'):
-            settings = root.media_manager.get_display_settings()
-            startup_enabled = bool(int(settings.get('startup_enabled', 0)))
-            print(f"DEBUG STARTUP: Loaded startup_enabled={startup_enabled} from settings")
-        
-        # Then check actual registry state
-        if hasattr(root, 'is_in_startup'):
-            registry_state = root.is_in_startup()
-            print(f"DEBUG STARTUP: Registry startup state is {registry_state}")
-            
-            # If there's a mismatch, use the registry state as source of truth
-            if registry_state != startup_enabled:
-                startup_enabled = registry_state
-                print(f"DEBUG STARTUP: Using registry state {startup_enabled} as source of truth")
-                
-                # Update settings to match registry
-                if hasattr(root, 'media_manager'):
-                    settings = root.media_manager.get_display_settings()
-                    settings['startup_enabled'] = 1 if startup_enabled else 0
-                    root.media_manager.update_display_settings(settings)
+        if self._media_manager is not None:
+            settings = self._media_manager.get_display_settings()
+            startup_enabled = _as_flag(settings.get('startup_enabled', 0))
+            logger.debug("Loaded startup_enabled=%s from settings", startup_enabled)
         
-        # Set the checkbox state
+        # Show the saved state now; the registry is the source of truth once it has been read
         self.startup_var.set(startup_enabled)
-        
-        # Initial update of monitor settings - force update to ensure correct monitors are set
-        print("DEBUG MONITOR_INIT: Forcing initial update of monitor settings")
-        self._update_monitors()
+        if hasattr(self._root, 'is_in_startup'):
+            # The registry read is cached on the root so rebuilding the panel doesn't repeat it
+            registry_state = getattr(self._root, '_cached_startup_state', None)
+            if registry_state is None:
+                threading.Thread(target=self._read_startup_state, daemon=True).start()
+                self._poll_startup_state()
+            else:
+                self._apply_startup_state(registry_state)
+        
+        # Initial update of monitor settings. If the saved selection was already valid, only the
+        # media display needs it; otherwise go through the full update to save the corrected list.
+        selected = [idx for idx, var in self.monitor_vars.items() if var.get()]
+        if loaded_monitors is not None and selected and set(selected) == set(loaded_monitors):
+            self._active_monitors = selected
+            if self._media_display is not None:
+                self._media_display.set_active_monitors(selected)
+        else:
+            self._update_monitors()
 
     def _update_monitors(self):
         """Update active monitors in MediaDisplay"""
-        root = self.frame.winfo_toplevel()
-        
         # Get selected monitors
-        active_monitors = [idx for idx, var in self.monitor_vars if var.get()]
+        active_monitors = [idx for idx, var in self.monitor_vars.items() if var.get()]
         
         # Ensure at least one monitor is selected
         if not active_monitors:
             # If none selected, select the first one
             if self.monitor_vars:
-                idx, var = self.monitor_vars[0]
-                var.set(True)
+                idx = next(iter(self.monitor_vars))
+                self.monitor_vars[idx].set(True)
                 active_monitors = [idx]
-                print("DEBUG UI: No monitors selected, defaulting to first monitor")
-                
-        # Convert to integers
-        active_monitors = [int(idx) for idx in active_monitors]
+                logger.debug("No monitors selected, defaulting to first monitor")
         
-        print(f"DEBUG UI: Updating active monitors to {active_monitors}")
+        # Remember the selection so get_active_monitors doesn't re-read every variable
+        self._active_monitors = active_monitors
+        
+        logger.debug("Updating active monitors to %s", active_monitors)
             
         # CRITICAL FIX: Save the monitor settings first
-        if hasattr(root, 'media_manager'):
-            settings = root.media_manager.get_display_settings()
-            settings['active_monitors'] = active_monitors
-            root.media_manager.update_display_settings(settings)
-            print(f"DEBUG UI: Saved monitor settings: {active_monitors}")
+        self._queue_settings(active_monitors=active_monitors)
             
         # Update media display
-        if hasattr(root, 'media_display'):
+        if self._media_display is not None:
             # Set active monitors using the setter method
-            root.media_display.set_active_monitors(active_monitors)
-            
-            # Verify the monitors were set correctly
-            print(f"DEBUG UI: Media display active monitors now: {root.media_display.active_monitors}")
+            self._media_display.set_active_monitors(active_monitors)
         
         # Refresh UI
         self._save_settings()
@@ -490,7 +529,20 @@ class DisplaySettingsPanel:
         self.frame.grid_rowconfigure(7, weight=0)  # Don't expand vertically - updated to row 7
     
     def _update_labels(self, event=None):
-        """Update the value labels for interval and max popups"""
+        """Update the value labels for interval, max popups and probability"""
+        self._update_interval_label()
+        self._update_popup_label()
+        self._update_probability_label()
+    
+    def _set_label_text(self, label, text):
+        """Configure a value label, skipping the Tk call when the text is unchanged"""
+        if self._last_label_texts.get(label) == text:
+            return
+        self._last_label_texts[label] = text
+        label.configure(text=text)
+    
+    def _update_interval_label(self):
+        """Update the interval value label"""
         interval = self.interval.get()
         if interval >= 60:
             minutes = int(interval // 60)
@@ -498,9 +550,15 @@ class DisplaySettingsPanel:
             text = f"{minutes}m {seconds}s"
         else:
             text = f"{interval:.1f}s"
-        self.interval_label.configure(text=text)
-        self.popup_label.configure(text=str(int(self.max_popups.get())))
-        self.probability_label.configure(text=f"{int(self.probability.get())}%")
+        self._set_label_text(self.interval_label, text)
+    
+    def _update_popup_label(self):
+        """Update the max popups value label"""
+        self._set_label_text(self.popup_label, str(self.max_popups.get()))
+    
+    def _update_probability_label(self):
+        """Update the popup probability value label"""
+        self._set_label_text(self.probability_label, f"{self.probability.get()}%")
     
     def set_running(self, is_running):
         """Update the UI state based on running status"""
@@ -522,294 +580,287 @@ class DisplaySettingsPanel:
     def _save_settings(self, event=None):
         """Save current settings to config"""
         try:
-            root = self.frame.winfo_toplevel()
-            if hasattr(root, 'media_manager'):
-                settings = root.media_manager.get_display_settings()
-                settings['interval'] = self.interval.get()
-                settings['max_popups'] = int(self.max_popups.get())
-                settings['popup_probability'] = int(self.probability.get())
-                
-                # CRITICAL FIX: Save bounce_enabled as integer 1/0 instead of boolean
-                bounce_enabled = self.bounce_chance.get() > 0
-                settings['bounce_enabled'] = 1 if bounce_enabled else 0
-                
-                # Save bounce chance setting
-                bounce_chance = self.bounce_chance.get()
-                settings['bounce_chance'] = bounce_chance
-                
-                # Save startup setting
-                startup_enabled = self.startup_var.get()
-                settings['startup_enabled'] = 1 if startup_enabled else 0
-                
-                # Save media probabilities
-                settings['image_prob'] = self.image_prob.get()
-                settings['gif_prob'] = self.gif_prob.get()
-                settings['video_prob'] = self.video_prob.get()
+            if self._media_manager is not None:
+                settings = {
+                    'interval': self.interval.get(),
+                    'max_popups': self.max_popups.get(),
+                    'popup_probability': self.probability.get(),
+                    # Startup is saved as integer 1/0
+                    'startup_enabled': 1 if self.startup_var.get() else 0,
+                    # Media probabilities
+                    'image_prob': self.image_prob.get(),
+                    'gif_prob': self.gif_prob.get(),
+                    'video_prob': self.video_prob.get(),
+                }
                 
                 # Debug log the saved settings
-                print(f"DEBUG SETTINGS: Saving bounce_enabled={settings['bounce_enabled']} (from {bounce_enabled})")
-                print(f"DEBUG SETTINGS: Saving bounce_chance={settings['bounce_chance']}% (from {bounce_chance})")
-                print(f"DEBUG SETTINGS: Saving startup_enabled={settings['startup_enabled']} (from {startup_enabled})")
-                print(f"DEBUG SETTINGS: Saving media probabilities - Image: {settings['image_prob']}%, GIF: {settings['gif_prob']}%, Video: {settings['video_prob']}%")
+                logger.debug("Saving display settings: %s", settings)
+                
+                self._queue_settings(**settings)
                 
-                root.media_manager.update_display_settings(settings)
+                # Bounce goes through the same path as the slider release
+                self._apply_bounce(self.bounce_chance.get())
                 
-                # Update media display if it exists
-                if hasattr(root, 'media_display'):
-                    root.media_display.set_bounce_enabled(bounce_enabled)
-                    root.media_display.bounce_chance = float(bounce_chance) / 100.0
-                    print(f"DEBUG SETTINGS: Updated media_display.bounce_enabled to {root.media_display.bounce_enabled}")
-                    
-                    # Update media weights
-                    root.media_display.set_media_weights(
+                # Update media weights if the media display exists
+                if self._media_display is not None:
+                    self._push_media_weights(
                         settings['image_prob'],
                         settings['gif_prob'],
                         settings['video_prob']
                     )
                 
         except Exception as e:
-            logger.error(f"Error saving settings: {e}")
+            logger.error("Error saving settings: %s", e)
+
+    def _queue_settings(self, **changes):
+        """Apply setting changes in memory now and write them to disk once edits settle"""
+        if self._media_manager is None:
+            return
+        # get_display_settings returns the live config dict, so readers see the change immediately
+        self._media_manager.get_display_settings().update(changes)
+        self._debounce('settings', 250, self._flush_settings)
+
+    def _flush_settings(self, defer=True):
+        """Write the display settings to disk, from the media manager's save timer unless told not to"""
+        try:
+            # The panel's debounce is the only coalescing layer; the timer just keeps the I/O off the Tk thread
+            self._media_manager.update_display_settings(self._media_manager.get_display_settings(), defer=defer)
+        except Exception as e:
+            logger.error("Error writing settings: %s", e)
+
+    def _on_destroy(self, event):
+        """Write out a pending settings flush before the panel is destroyed"""
+        if event.widget is not self.frame:
+            return
+        # The variables belong to the caller and outlive this panel, so drop the label traces
+        for var, trace_id in self._label_traces:
+            var.trace_remove('write', trace_id)
+        self._label_traces = []
+        if self._populate_monitors_id is not None:
+            self.frame.after_cancel(self._populate_monitors_id)
+            self._populate_monitors_id = None
+        if self._startup_poll_id is not None:
+            self.frame.after_cancel(self._startup_poll_id)
+            self._startup_poll_id = None
+        pending = self._debounce_ids.pop('settings', None)
+        if pending is not None:
+            self.frame.after_cancel(pending)
+            # Written synchronously: this can run after the shutdown flush_config
+            self._flush_settings(defer=False)
 
     def get_bounce_enabled(self):
         """Get bounce enabled setting"""
         return self.bounce_chance.get() > 0
 
     def get_active_monitors(self):
-        """Get list of active monitor indices"""
-        # Get the currently selected monitors
-        active_monitors = [int(idx) for idx, var in self.monitor_vars if var.get()]
-        
-        # Ensure at least one monitor is selected
-        if not active_monitors and self.monitor_vars:
-            # Default to first monitor
-            active_monitors = [int(self.monitor_vars[0][0])]
-            print(f"DEBUG UI: No monitors selected, defaulting to first monitor {active_monitors}")
-            
-        print(f"DEBUG UI: Returning active monitors: {active_monitors}")
-        
-        # CRITICAL FIX: Save the monitor settings
-        root = self.frame.winfo_toplevel()
-        if hasattr(root, 'media_manager'):
-            settings = root.media_manager.get_display_settings()
-            settings['active_monitors'] = active_monitors
-            root.media_manager.update_display_settings(settings)
-            print(f"DEBUG UI: Saved monitor settings: {active_monitors}")
-        
-        # Force update the media_display
-        if hasattr(root, 'media_display'):
-            # Set active monitors using the setter method
-            root.media_display.set_active_monitors(active_monitors)
-            
-            # Verify the monitors were set correctly
-            print(f"DEBUG UI: Media display active monitors now: {root.media_display.active_monitors}")
-            
-        return active_monitors
+        """Get list of active monitor indices (saving and applying a selection is _update_monitors' job)"""
+        return list(self._active_monitors)
+
+    def _debounce(self, key, ms, fn, *args):
+        """Run fn(*args) once, ms after the last call for the same key"""
+        pending = self._debounce_ids.get(key)
+        if pending is not None:
+            self.frame.after_cancel(pending)
+        self._debounce_ids[key] = self.frame.after(ms, self._run_debounced, key, fn, args)
+
+    def _run_debounced(self, key, fn, args):
+        """Clear the pending id for key and run the debounced callback"""
+        self._debounce_ids.pop(key, None)
+        fn(*args)
 
     def _update_bounce_settings(self, *args):
-        """Update bounce settings based on slider"""
-        # Get the current bounce chance
-        chance = float(self.bounce_chance.get())
-        
+        """Update bounce settings based on slider (settings are saved on release)"""
+        chance = self.bounce_chance.get()
+        # The label shows whole percents; skip events that don't change it
+        ic = int(chance)
+        if ic == self._last_bounce_int:
+            return
+        self._last_bounce_int = ic
+        self._apply_bounce_live(chance)
+
+    def _apply_bounce_live(self, chance):
+        """Show the bounce chance and apply it to the media display"""
         # Determine if bounce is enabled based on chance value
         enabled = chance > 0
         
         # Update the label
-        self.bounce_chance_label.configure(text=f"{int(chance)}%")
+        self._set_label_text(self.bounce_chance_label, f"{int(chance)}%")
         
-        print(f"DEBUG UI_BOUNCE: Setting bounce enabled={enabled}, chance={chance}%")
-        
-        # Get the root window
-        root = self.frame.winfo_toplevel()
+        logger.debug("Setting bounce enabled=%s, chance=%s%%", enabled, chance)
         
         # Update the media display
-        if hasattr(root, 'media_display'):
-            # Set bounce enabled based on chance value
-            root.media_display.set_bounce_enabled(enabled)
-            # Convert from percentage to decimal for internal use (0-100% -> 0.0-1.0)
-            decimal_chance = chance / 100.0
-            root.media_display.bounce_chance = decimal_chance
-            
-            # Verify the settings were applied
-            print(f"DEBUG UI_BOUNCE: Updated media_display.bounce_enabled to {root.media_display.bounce_enabled}")
-            print(f"DEBUG UI_BOUNCE: Updated media_display.bounce_chance to {root.media_display.bounce_chance} ({root.media_display.bounce_chance*100}%)")
-        
-        # Save the settings to config
-        if hasattr(root, 'media_manager'):
-            settings = root.media_manager.get_display_settings()
-            # Save bounce enabled as integer based on chance value
-            settings['bounce_enabled'] = 1 if enabled else 0
-            # Save chance as percentage value (0-100)
-            settings['bounce_chance'] = chance
-            root.media_manager.update_display_settings(settings)
-            print(f"DEBUG UI_BOUNCE: Saved bounce_enabled={settings['bounce_enabled']} to settings")
-            print(f"DEBUG UI_BOUNCE: Saved bounce_chance={settings['bounce_chance']}% to settings")
+        if self._media_display is not None:
+            self._push_bounce(enabled, chance)
+
+    def _push_bounce(self, enabled, chance, force=False):
+        """Send bounce settings to the media display, skipping the setter when enabled is unchanged"""
+        # set_bounce_enabled starts or stops the animation thread, so only call it on a real change
+        if force or self._media_display.bounce_enabled != enabled:
+            self._media_display.set_bounce_enabled(enabled)
+        # Convert from percentage to decimal for internal use (0-100% -> 0.0-1.0)
+        self._media_display.bounce_chance = chance / 100.0
+
+    def _push_media_weights(self, image, gif, video):
+        """Send media weights to the media display if they differ from the last ones sent"""
+        weights = (image, gif, video)
+        if weights == self._pushed_weights:
+            return
+        self._pushed_weights = weights
+        self._media_display.set_media_weights(image, gif, video)
+
+    def _apply_bounce(self, chance):
+        """Apply a bounce chance to the label and media display and queue it for saving"""
+        enabled = chance > 0
+        self._apply_bounce_live(chance)
+        
+        # Save bounce enabled as integer 1/0 and chance as percentage value (0-100)
+        self._queue_settings(bounce_enabled=1 if enabled else 0, bounce_chance=chance)
+        return enabled
+
+    def _flush_bounce(self, event=None):
+        """Save the current bounce settings to config"""
+        # Apply the exact final value, which the live updates may have skipped
+        chance = self.bounce_chance.get()
+        enabled = self._apply_bounce(chance)
         
         # Log the change
-        logger.info(f"Bounce settings updated: enabled={enabled}, chance={chance}%")
+        logger.info("Bounce settings updated: enabled=%s, chance=%s%%", enabled, chance)
+
+    def _update_media_prob_labels(self, values=None):
+        """Update the media probability labels, from (image, gif, video) when the caller has them"""
+        if values is None:
+            values = tuple(var.get() for var in self._prob_vars.values())
+        for label, value in zip(self._prob_labels, values):
+            text = f"{value:3d}%"  # Fixed width format
+            # Only the labels whose value moved need a configure call
+            if self._last_label_texts.get(label) != text:
+                self._last_label_texts[label] = text
+                label.configure(text=text)
 
-    def _update_media_prob_labels(self):
-        """Update the media probability labels"""
-        self.image_label.configure(text=f"{self.image_prob.get():3d}%")  # Fixed width format
-        self.gif_label.configure(text=f"{self.gif_prob.get():3d}%")    # Fixed width format
-        self.video_label.configure(text=f"{self.video_prob.get():3d}%")  # Fixed width format
+    def _on_media_prob_motion(self, current):
+        """Rebalance the media sliders once a burst of drag events settles"""
+        self.currently_adjusting = current
+        self._debounce('media_probs', 50, self._adjust_media_probs, current)
 
     def _adjust_media_probs(self, current):
         """Adjust media probabilities to maintain 100% total"""
         # Determine which slider is being adjusted
         self.currently_adjusting = current
         
-        # Get current values
-        image_val = self.image_prob.get()
-        gif_val = self.gif_prob.get()
-        video_val = self.video_prob.get()
-        
-        # Calculate total
-        total = image_val + gif_val + video_val
-        
-        # If total is 100%, no need to adjust
-        if total == 100:
-            self._update_media_prob_labels()
+        # Get current values, skipping the work if nothing moved since the last adjustment
+        values = {name: var.get() for name, var in self._prob_vars.items()}
+        triple = tuple(values.values())
+        if triple == self._last_prob_triple:
             return
         
-        # Calculate how much we need to adjust
-        diff = 100 - total
-        
-        # Adjust other sliders based on which one is currently being moved
-        if current == "image":
-            # Distribute the difference proportionally between gif and video
-            if gif_val + video_val > 0:
-                gif_ratio = gif_val / (gif_val + video_val)
-                video_ratio = video_val / (gif_val + video_val)
-                
-                gif_adjustment = int(diff * gif_ratio)
-                video_adjustment = diff - gif_adjustment
-                
-                new_gif = max(0, gif_val + gif_adjustment)
-                new_video = max(0, video_val + video_adjustment)
-                
-                # Set new values
-                self.gif_prob.set(new_gif)
-                self.video_prob.set(new_video)
-            else:
-                # If both are zero, set one of them to the difference
-                self.gif_prob.set(max(0, diff))
-                self.video_prob.set(0)
-        elif current == "gif":
-            # Distribute the difference proportionally between image and video
-            if image_val + video_val > 0:
-                image_ratio = image_val / (image_val + video_val)
-                video_ratio = video_val / (image_val + video_val)
-                
-                image_adjustment = int(diff * image_ratio)
-                video_adjustment = diff - image_adjustment
-                
-                new_image = max(0, image_val + image_adjustment)
-                new_video = max(0, video_val + video_adjustment)
-                
-                # Set new values
-                self.image_prob.set(new_image)
-                self.video_prob.set(new_video)
-            else:
-                # If both are zero, set one of them to the difference
-                self.image_prob.set(max(0, diff))
-                self.video_prob.set(0)
-        elif current == "video":
-            # Distribute the difference proportionally between image and gif
-            if image_val + gif_val > 0:
-                image_ratio = image_val / (image_val + gif_val)
-                gif_ratio = gif_val / (image_val + gif_val)
-                
-                image_adjustment = int(diff * image_ratio)
-                gif_adjustment = diff - image_adjustment
-                
-                new_image = max(0, image_val + image_adjustment)
-                new_gif = max(0, gif_val + gif_adjustment)
-                
-                # Set new values
-                self.image_prob.set(new_image)
-                self.gif_prob.set(new_gif)
-            else:
-                # If both are zero, set one of them to the difference
-                self.image_prob.set(max(0, diff))
-                self.gif_prob.set(0)
+        if sum(triple) != 100:
+            triple = self._renormalize(values, current)
+        self._last_prob_triple = triple
         
         # Update the labels
-        self._update_media_prob_labels()
+        self._update_media_prob_labels(triple)
+
+    def _renormalize(self, values, locked_key):
+        """Scale the sliders other than locked_key so all three sum to 100, using largest remainders"""
+        free = [name for name in values if name != locked_key]
+        target = 100 - values.get(locked_key, 0)
+        pool = sum(values[name] for name in free)
+        
+        new_values = dict(values)
+        if pool > 0:
+            # Floor each proportional share, then hand the leftover points to the largest remainders
+            remainders = {}
+            for name in free:
+                new_values[name], remainders[name] = divmod(values[name] * target, pool)
+            leftover = target - sum(new_values[name] for name in free)
+            for name in sorted(free, key=remainders.get, reverse=True)[:leftover]:
+                new_values[name] += 1
+        else:
+            # If the free sliders are all zero, give the whole share to the first one
+            for name in free:
+                new_values[name] = 0
+            new_values[free[0]] = target
+        
+        for name in free:
+            if new_values[name] != values[name]:
+                self._prob_vars[name].set(new_values[name])
+        return tuple(new_values.values())
 
     def _save_media_probs(self, event=None):
         """Save media probabilities to settings and apply to media display"""
+        # Run a rebalance still waiting on the drag debounce so the final position isn't dropped
+        pending = self._debounce_ids.pop('media_probs', None)
+        if pending is not None:
+            self.frame.after_cancel(pending)
+            self._adjust_media_probs(self.currently_adjusting)
+        
         # Ensure total is exactly 100% (might be off by 1 due to rounding)
-        self._ensure_total_100()
+        image, gif, video = self._ensure_total_100()
         
         # Update the UI
-        self._update_media_prob_labels()
+        self._update_media_prob_labels((image, gif, video))
         
         # Save to settings
         try:
-            root = self.frame.winfo_toplevel()
-            if hasattr(root, 'media_manager'):
-                settings = root.media_manager.get_display_settings()
-                
+            if self._media_manager is not None:
                 # Save media probabilities
-                settings['image_prob'] = self.image_prob.get()
-                settings['gif_prob'] = self.gif_prob.get()
-                settings['video_prob'] = self.video_prob.get()
-                
-                root.media_manager.update_display_settings(settings)
+                self._queue_settings(image_prob=image, gif_prob=gif, video_prob=video)
                 
                 # Apply to media display
-                if hasattr(root, 'media_display'):
-                    root.media_display.set_media_weights(
-                        self.image_prob.get(),
-                        self.gif_prob.get(),
-                        self.video_prob.get()
-                    )
-                    print(f"DEBUG: Applied media weights - Image: {self.image_prob.get()}%, GIF: {self.gif_prob.get()}%, Video: {self.video_prob.get()}%")
+                if self._media_display is not None:
+                    self._push_media_weights(image, gif, video)
         except Exception as e:
-            logger.error(f"Error saving media probabilities: {e}")
+            logger.error("Error saving media probabilities: %s", e)
 
     def _ensure_total_100(self):
-        """Ensure the total of all media probabilities is exactly 100%"""
-        image_val = self.image_prob.get()
-        gif_val = self.gif_prob.get()
-        video_val = self.video_prob.get()
-        
-        total = image_val + gif_val + video_val
-        
-        if total != 100:
-            # Adjust the value that's not currently being adjusted
-            diff = 100 - total
+        """Ensure the total of all media probabilities is exactly 100% and return (image, gif, video)"""
+        values = {name: var.get() for name, var in self._prob_vars.items()}
+        if sum(values.values()) == 100:
+            return tuple(values.values())
+        # Keep the slider the user moved; with none, rescale all three
+        self._last_prob_triple = self._renormalize(values, self.currently_adjusting)
+        return self._last_prob_triple
+
+    def _read_startup_state(self):
+        """Read the startup registry state on a worker thread and queue it for the Tk thread"""
+        # No Tk calls here: after() from another thread raises RuntimeError when this
+        # runs before mainloop() (the panel is populated from update_idletasks in run())
+        self._startup_state_queue.put(self._root.is_in_startup())
+
+    def _poll_startup_state(self):
+        """Apply the registry state once the worker has read it (runs on the Tk thread)"""
+        self._startup_poll_id = None
+        try:
+            registry_state = self._startup_state_queue.get_nowait()
+        except queue.Empty:
+            self._startup_poll_id = self.frame.after(50, self._poll_startup_state)
+            return
+        self._on_startup_state_read(registry_state)
+
+    def _on_startup_state_read(self, registry_state):
+        """Cache the registry state unless a toggle already recorded a newer one"""
+        if getattr(self._root, '_cached_startup_state', None) is None:
+            self._root._cached_startup_state = registry_state
+        self._apply_startup_state(self._root._cached_startup_state)
+
+    def _apply_startup_state(self, registry_state):
+        """Sync the startup checkbox and settings with the registry state"""
+        logger.debug("Registry startup state is %s", registry_state)
+        
+        # If there's a mismatch, use the registry state as source of truth
+        if registry_state != self.startup_var.get():
+            logger.info("Using registry startup state %s as source of truth", registry_state)
+            self.startup_var.set(registry_state)
             
-            if self.currently_adjusting == "image":
-                if gif_val > 0:
-                    self.gif_prob.set(gif_val + diff)
-                elif video_val > 0:
-                    self.video_prob.set(video_val + diff)
-            elif self.currently_adjusting == "gif":
-                if image_val > 0:
-                    self.image_prob.set(image_val + diff)
-                elif video_val > 0:
-                    self.video_prob.set(video_val + diff)
-            elif self.currently_adjusting == "video":
-                if image_val > 0:
-                    self.image_prob.set(image_val + diff)
-                elif gif_val > 0:
-                    self.gif_prob.set(gif_val + diff)
-            else:
-                # If no slider is being adjusted, adjust the largest one
-                largest = max(image_val, gif_val, video_val)
-                if largest == image_val:
-                    self.image_prob.set(image_val + diff)
-                elif largest == gif_val:
-                    self.gif_prob.set(gif_val + diff)
-                else:
-                    self.video_prob.set(video_val + diff)
+            # Update settings to match registry
+            self._queue_settings(startup_enabled=1 if registry_state else 0)
 
     def _toggle_startup(self):
         """Handle startup toggle"""
-        root = self.frame.winfo_toplevel()
-        if hasattr(root, 'manage_startup'):
-            success = root.manage_startup(self.startup_var.get())
-            if not success:
+        if hasattr(self._root, 'manage_startup'):
+            success = self._root.manage_startup(self.startup_var.get())
+            if success:
+                self._root._cached_startup_state = self.startup_var.get()
+            else:
                 # Revert checkbox if operation failed
                 self.startup_var.set(not self.startup_var.get())
\ No newline at end of file